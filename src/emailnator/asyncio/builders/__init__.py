@@ -17,9 +17,17 @@
 # <https://www.gnu.org/licenses/>.
 
 from emailnator.asyncio.builders.builders import AsyncEmailnatorClient
+from emailnator.asyncio.builders.backends import (
+    AiohttpBackend,
+    ClientBackend,
+    HttpxBackend,
+)
 from emailnator.asyncio.builders import helpers
 
 __all__: tuple[str, ...] = (
     "AsyncEmailnatorClient",
+    "ClientBackend",
+    "HttpxBackend",
+    "AiohttpBackend",
     "helpers",
 )
@@ -0,0 +1,223 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""
+HTTP backends used to send requests to the EmailNator API.
+
+This module defines the `ClientBackend` protocol and its implementations.
+Every backend returns an `httpx.Response`, so response parsing is the same
+regardless of the transport in use:
+
+    - `HttpxBackend`: sends requests with the shared `httpx.AsyncClient`.
+    - `AiohttpBackend`: sends requests with one shared `aiohttp.ClientSession`
+      (requires the optional ``aiohttp`` package).
+
+Both backends use the cookie jar of the shared `httpx.AsyncClient`, so the
+XSRF cookies handled by `XsrfManager` apply to every backend.
+
+Typical Usage Example:
+    from emailnator.asyncio.builders.backends import create_backend
+
+    backend = create_backend("httpx", client)
+    response = await backend.post(url, headers=headers, content=body)
+"""
+from __future__ import annotations
+
+import httpx
+
+from typing import Any, Mapping, Protocol
+
+from emailnator.config.config import config
+
+
+class ClientBackend(Protocol):
+    """
+    Interface of an HTTP backend used for EmailNator API requests.
+    """
+    async def post(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        content: bytes,
+    ) -> httpx.Response:
+        """
+        Send a POST request with a pre-encoded JSON body.
+
+        Args:
+            url (str): The request URL.
+            headers (Mapping[str, str]): Request headers, including the
+                ``Content-Type`` of the body.
+            content (bytes): The encoded request body.
+
+        Returns:
+            httpx.Response: The fully read response.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """
+        Release resources owned by the backend.
+        """
+        ...
+
+
+class HttpxBackend:
+    """
+    Backend that sends requests through the shared `httpx.AsyncClient`.
+
+    Attributes:
+        _client (httpx.AsyncClient): The client used to send requests. It is
+            owned by `AsyncEmailnatorClient` and is not closed here.
+    """
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            client (httpx.AsyncClient): The shared asynchronous HTTP client.
+        """
+        self._client: httpx.AsyncClient = client
+
+    async def post(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        content: bytes,
+    ) -> httpx.Response:
+        return await self._client.post(url, headers=headers, content=content)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class AiohttpBackend:
+    """
+    Backend that sends requests through one shared `aiohttp.ClientSession`.
+
+    Cookies are read from and written back to the cookie jar of the shared
+    `httpx.AsyncClient`, and responses are converted to `httpx.Response`.
+
+    Attributes:
+        _cookies (httpx.Cookies): Cookie jar shared with the httpx client.
+        _session (aiohttp.ClientSession | None): Session created on first use.
+    """
+    _SKIPPED_HEADERS: frozenset[str] = frozenset(
+        {"content-encoding", "content-length", "transfer-encoding"}
+    )
+
+    def __init__(self, cookies: httpx.Cookies) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            cookies (httpx.Cookies): Cookie jar of the shared httpx client.
+
+        Raises:
+            RuntimeError: If the ``aiohttp`` package is not installed.
+        """
+        try:
+            import aiohttp
+        except ImportError as exc:
+            raise RuntimeError(
+                "HTTP_BACKEND 'aiohttp' requires the 'aiohttp' package."
+            ) from exc
+
+        self._aiohttp: Any = aiohttp
+        self._cookies: httpx.Cookies = cookies
+        self._session: Any = None
+
+    def _get_session(self) -> Any:
+        """
+        Return the shared session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+        """
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                headers={"User-Agent": config.USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=config.TIMEOUT),
+            )
+        return self._session
+
+    async def post(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        content: bytes,
+    ) -> httpx.Response:
+        request: httpx.Request = httpx.Request(
+            "POST",
+            url,
+            headers=headers,
+            content=content
+        )
+        self._cookies.set_cookie_header(request)
+
+        async with self._get_session().post(
+            url,
+            headers=dict(request.headers),
+            data=content,
+            proxy=config.PROXY,
+        ) as response:
+            body: bytes = await response.read()
+            response_headers: list[tuple[bytes, bytes]] = [
+                (key, value) for key, value in response.raw_headers
+                if key.decode("latin-1").lower() not in self._SKIPPED_HEADERS
+            ]
+
+        result: httpx.Response = httpx.Response(
+            response.status,
+            headers=response_headers,
+            content=body,
+            request=request,
+        )
+        self._cookies.extract_cookies(result)
+        return result
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def create_backend(name: str, client: httpx.AsyncClient) -> ClientBackend:
+    """
+    Create the HTTP backend with the given name.
+
+    Args:
+        name (str): Backend name, either ``"httpx"`` or ``"aiohttp"``.
+        client (httpx.AsyncClient): The shared asynchronous HTTP client.
+
+    Returns:
+        ClientBackend: The backend instance.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        RuntimeError: If the backend's optional dependency is missing.
+    """
+    if name == "httpx":
+        return HttpxBackend(client)
+    if name == "aiohttp":
+        return AiohttpBackend(client.cookies)
+    raise ValueError(
+        f"Unknown HTTP_BACKEND '{name}'. Must be 'httpx' or 'aiohttp'."
+    )
@@ -41,15 +41,23 @@ from __future__ import annotations
 import asyncio
 import httpx
 
+from typing import Mapping
+
+from emailnator.asyncio.builders.backends import ClientBackend, create_backend
 from emailnator.asyncio.builders.helpers.metaclass import AsyncSingletonMeta
 from emailnator.asyncio.builders.helpers.xsrf_token_service import XsrfManager
 from emailnator.config.config import config
 from emailnator.helpers import logger
 
 
+_DEFAULT_HEADERS: httpx.Headers = httpx.Headers(
+    {"User-Agent": config.USER_AGENT_BYTES}
+)
+
+
 class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
     """
-    A singleton wrapper around `httpx.AsyncClient` that manages XSRF tokens and standard headers.
+    A per-event-loop singleton wrapper around `httpx.AsyncClient` that manages XSRF tokens and standard headers.
 
     This class ensures that only one instance exists and provides thread-safe methods
     to interact with the HTTP client. It automatically handles fetching, decoding, 
@@ -57,6 +65,7 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
 
     The following functionality is provided:
         - Access to the HTTP client via `get_client()`.
+        - Access to the configured HTTP backend via `get_backend()`.
         - Fetching or automatically ensuring the XSRF token and headers.
         - Forcibly refreshing the XSRF token with `refresh_token()`.
         - Closing the client and clearing internal state with `close()`.
@@ -64,19 +73,37 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
 
     Attributes:
         _client (httpx.AsyncClient): The HTTP client used for making requests.
+        _backend (ClientBackend): The backend selected by `config.HTTP_BACKEND`.
         _xsrf_token (Optional[str]): The XSRF token for CSRF protection, initially None.
-        _headers (dict[str, str]): A dictionary storing HTTNoneinternal_lock (threading.Lock): A reentrant lock for thread-safe operations.
-        _initialized (bool): Flag indicating whether the instance has been initialized.
+        _xsrf (XsrfManager): Fetches the XSRF token on first use and
+            refreshes it once it is older than `XsrfManager.token_max_age`.
+        _internal_lock (asyncio.Lock): A lock for safe life-cycle operations.
     """
     async def __ainit__(self) -> None:
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=config.MAX_CONN,
+            max_keepalive_connections=config.MAX_KEEPALIVE,
+            keepalive_expiry=60.0,
+        )
+        # The explicit transport owns the connection pool, so http2, limits
+        # and the proxy are configured on it alone.
         self._client: httpx.AsyncClient = httpx.AsyncClient(
-            proxy=config.PROXY if config.PROXY else None,
-            http2=config.USE_HTTP2,
             timeout=config.TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                proxy=config.PROXY if config.PROXY else None,
+                http2=config.USE_HTTP2,
+                limits=limits,
+                retries=1,
+            ),
+            headers=_DEFAULT_HEADERS,
             trust_env=False
         )
         self._internal_lock: asyncio.Lock = asyncio.Lock()
         self._xsrf: XsrfManager = XsrfManager(self._client)
+        self._backend: ClientBackend = create_backend(
+            config.HTTP_BACKEND,
+            self._client
+        )
 
     # --- Life-cycle ---
     async def close(self) -> None:
@@ -90,11 +117,14 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
             - Closes the HTTP client (`_client`) safely.
             - Resets the XSRF token (`_xsrf_token`) to None.
             - Clears the HTTP headers (`_headers`).
+            - Removes the instance from the per-loop singleton registry, so
+              the next `AsyncEmailnatorClient()` builds a fresh client.
 
         """
         assert self._internal_lock is not None, "_internal_lock not initialized"
         async with self._internal_lock:
             try:
+                await self._backend.aclose()
                 client = await self.get_client()
                 await client.aclose()
             except Exception:
@@ -102,6 +132,26 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
             self._xsrf_token = None
             self._headers = {}
 
+        instances = type(self)._instances
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if instances.get(loop) is self:
+            del instances[loop]
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Close the client shared on the running event loop, if one exists.
+
+        Instances are per-loop singletons, so this closes the HTTP client
+        used by every `Generators` and `MessageGetter` on the loop. A later
+        `AsyncEmailnatorClient()` builds a fresh one.
+        """
+        instance: AsyncEmailnatorClient | None = cls._instances.get(
+            asyncio.get_running_loop()
+        )
+        if instance is not None:
+            await instance.close()
+
     def __enter__(self) -> "AsyncEmailnatorClient":
         """
         Enters the runtime context for the singleton instance.
@@ -128,7 +178,10 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
                 was raised, else None.
         """
         logger.debug(
-            f"Builders service was closed exception type: {exc_type}, exception: {exc}, traceback: {tb}"
+            "Builders service was closed exception type: %s, exception: %s, traceback: %s",
+            exc_type,
+            exc,
+            tb
         )
         await self.close()
 
@@ -142,6 +195,15 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
         """
         return self._client
 
+    async def get_backend(self) -> ClientBackend:
+        """
+        Returns the HTTP backend selected by `config.HTTP_BACKEND`.
+
+        Returns:
+            ClientBackend: The backend used to send API requests.
+        """
+        return self._backend
+
     # --- Delegate to XsrfManager ---
     async def get_xsrf_token(self) -> str:
         assert self._xsrf is not None
@@ -151,6 +213,10 @@ class AsyncEmailnatorClient(metaclass=AsyncSingletonMeta):
         assert self._xsrf is not None
         return await self._xsrf.get_headers()
 
+    async def get_headers_view(self) -> Mapping[str, str]:
+        assert self._xsrf is not None
+        return await self._xsrf.get_headers_view()
+
     async def refresh_token(self) -> None:
         assert self._xsrf is not None
         await self._xsrf.refresh()
@@ -20,8 +20,8 @@
 Asynchronous singleton metaclass.
 
 This module defines `AsyncSingletonMeta`, a metaclass that ensures a class
-has only one instance in asynchronous contexts. It provides thread-safe
-singleton behavior using an `asyncio.Lock` and supports asynchronous
+has only one instance per event loop in asynchronous contexts. It provides
+safe singleton behavior for concurrent callers and supports asynchronous
 initialization via the `__ainit__` method.
 
 Typical Usage Example:
@@ -36,37 +36,73 @@ Typical Usage Example:
         assert obj1 is obj2
 """
 import asyncio
+import weakref
 
 from typing import Any
 
 
 class AsyncSingletonMeta(type):
     """
-    Asynchronous metaclass for implementing singleton classes with thread safety.
+    Asynchronous metaclass for implementing per-event-loop singleton classes.
 
-    This metaclass ensures that only one instance of a class exists, even in
-    asynchronous contexts with potential concurrent instantiation. It uses an
-    ``asyncio.Lock`` to guarantee that only one coroutine initializes the singleton
-    at a time. If the class defines an asynchronous initializer (``__ainit__``),
-    it will be awaited during instance creation.
+    This metaclass ensures that only one instance of a class exists for each
+    running event loop, even with potential concurrent instantiation. Objects
+    such as HTTP clients are bound to the loop they were created in, so
+    keying instances by loop lets every caller on the same loop share one
+    instance while callers on other loops get their own. The first caller
+    on a loop registers a pending future and awaits the asynchronous
+    initializer (``__ainit__``); concurrent callers await that future.
+    Checking the registries and registering the future happen without an
+    ``await`` in between, so they are atomic on the loop and no
+    ``asyncio.Lock`` (which would bind to whichever loop first contends
+    for it) is needed.
 
     Attributes:
-        _instances (dict): A mapping of classes to their singleton instances.
-        _lock (asyncio.Lock): A global lock used to prevent race conditions during
-            singleton initialization.
+        _instances (weakref.WeakKeyDictionary): Per-class mapping of event
+            loops to their fully initialized singleton instances. Entries
+            disappear when the loop is garbage collected.
+        _pending (weakref.WeakKeyDictionary): Per-class mapping of event
+            loops to futures resolved with the instance once its
+            initialization finishes.
+        _has_ainit (bool): Whether the class defines or inherits `__ainit__`,
+            resolved once when the class is created.
     """
-    _instances: dict = {}
-    _lock: asyncio.Lock = asyncio.Lock()
+    def __init__(
+        cls,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        **kwargs: Any
+    ) -> None:
+        """
+        Initialize the class with its own loop-to-instance registry and
+        cache whether it defines `__ainit__`.
+
+        Args:
+            name (str): Name of the class being created.
+            bases (tuple[type, ...]): Base classes of the class.
+            namespace (dict[str, Any]): Class body namespace.
+            **kwargs (Any): Extra class keyword arguments.
+        """
+        super().__init__(name, bases, namespace, **kwargs)
+        cls._instances: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Any
+        ] = weakref.WeakKeyDictionary()
+        cls._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Future[Any]
+        ] = weakref.WeakKeyDictionary()
+        cls._has_ainit: bool = getattr(cls, "__ainit__", None) is not None
 
     async def __call__(cls, *args: Any, **kwargs: Any) -> Any:
         """
-        Create or return the singleton instance of a class (with async initialization).
+        Create or return the singleton instance of a class for the running loop.
 
         This method overrides the default metaclass ``__call__`` to implement
-        asynchronous singleton behavior. If an instance does not yet exist,
-        it acquires a lock to ensure safe concurrent initialization, creates
-        the instance, and calls its asynchronous initializer (``__ainit__``)
-        if available.
+        asynchronous singleton behavior. An initialized instance is returned
+        directly. Otherwise the first caller creates the instance and awaits
+        its asynchronous initializer (``__ainit__``), while concurrent callers
+        wait for that initialization to finish. If it fails, every waiting
+        caller receives the error and the next call starts over.
 
         Args:
             *args (Any): Positional arguments forwarded to the class constructor.
@@ -75,11 +111,31 @@ class AsyncSingletonMeta(type):
         Returns:
             Any: The existing or newly created singleton instance of the class.
         """
-        if cls not in cls._instances:
-            async with cls._lock:
-                if cls not in cls._instances:
-                    instance: Any = super().__call__(*args, **kwargs)
-                    cls._instances[cls] = instance
-                    if hasattr(instance, "__ainit__"):
-                        await instance.__ainit__(*args, **kwargs)
-        return cls._instances[cls]
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        instance: Any = cls._instances.get(loop)
+        if instance is not None:
+            return instance
+
+        pending: asyncio.Future[Any] | None = cls._pending.get(loop)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        pending = loop.create_future()
+        cls._pending[loop] = pending
+
+        try:
+            instance = super().__call__(*args, **kwargs)
+            if cls._has_ainit:
+                await instance.__ainit__(*args, **kwargs)
+        except BaseException as exc:
+            del cls._pending[loop]
+            if isinstance(exc, asyncio.CancelledError):
+                pending.cancel()
+            else:
+                pending.set_exception(exc)
+                pending.exception()
+            raise
+        cls._instances[loop] = instance
+        del cls._pending[loop]
+        pending.set_result(instance)
+        return instance
@@ -24,9 +24,11 @@ handling the lifecycle of XSRF authentication tokens used when making
 requests to the EmailNator API. It ensures that valid tokens are fetched,
 decoded, refreshed, and included in the request headers.
 
-The manager is designed for asynchronous environments and uses an
-`asyncio.Lock` to guarantee safe concurrent access to token initialization
-and refresh operations.
+The manager is designed for asynchronous environments: concurrent callers
+share a single in-flight initialization or refresh task instead of queuing
+on a lock, so a burst of first requests triggers only one token fetch.
+Tokens are refreshed on demand once they are older than `token_max_age`,
+so no background task is needed.
 
 Typical Usage Example:
     import httpx, asyncio
@@ -40,11 +42,16 @@ Typical Usage Example:
 
         asyncio.run(main())
 """
-import urllib.parse
 import httpx
 import asyncio
+import time
+
+from types import MappingProxyType
+from typing import Mapping
+from urllib.parse import unquote as _unquote
 
 from emailnator.config.config import config
+from emailnator.helpers import logger
 
 
 class XsrfManager:
@@ -60,11 +67,36 @@ class XsrfManager:
         _client (httpx.AsyncClient): The asynchronous HTTP client used for
             making requests to the EmailNator API.
         _token (str | None): Cached XSRF token. None if not yet initialized.
-        _headers (dict[str, str]): Default HTTP headers containing the XSRF
+        _fetched_at (float): `time.monotonic()` value when the current
+            token was stored.
+        _headers (Mapping[str, str]): Read-only HTTP headers containing the XSRF
             token and other required metadata.
-        _lock (asyncio.Lock): Concurrency lock to ensure thread-safe token
-            initialization and refresh operations.
+        _init_task (asyncio.Task[None] | None): In-flight or completed token
+            initialization shared by concurrent callers. Reset after a
+            failure so the next call retries.
+        _refresh_task (asyncio.Task[None] | None): In-flight token refresh
+            shared by concurrent callers.
+        _BASE_URL (str): URL the token is fetched from.
+        _REFERER (str): Value of the ``Referer`` header.
+        _USE_HEAD (bool): Whether to try a HEAD request before GET when
+            fetching the token.
+        _STATIC_HEADERS (tuple[tuple[str, str], ...]): Header items that do
+            not depend on the token, built once when the class is defined.
+            The ``User-Agent`` is left to the client's default headers.
+        token_max_age (float): Seconds after which `get_headers_view()` refreshes
+            the token before returning.
     """
+    token_max_age: float = 1800.0
+    _BASE_URL: str = config.BASE_URL
+    _REFERER: str = config.BASE_URL + "/"
+    _USE_HEAD: bool = config.XSRF_USE_HEAD
+    _STATIC_HEADERS: tuple[tuple[str, str], ...] = (
+        ("Content-Type", "application/json"),
+        ("X-Requested-With", "XMLHttpRequest"),
+        ("DNT", "1"),
+        ("Referer", _REFERER),
+    )
+
     def __init__(self, client: httpx.AsyncClient) -> None:
         """
         Initialize the token manager.
@@ -75,31 +107,72 @@ class XsrfManager:
         """
         self._client = client
         self._token: str | None = None
-        self._headers: dict[str, str] = {}
-        self._lock = asyncio.Lock()
+        self._fetched_at: float = 0.0
+        self._headers: Mapping[str, str] = MappingProxyType({})
+        self._init_task: asyncio.Task[None] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _token_from_headers(response: httpx.Response) -> str | None:
+        """
+        Read the raw ``XSRF-TOKEN`` value from a response's ``Set-Cookie`` headers.
+
+        Args:
+            response (httpx.Response): The response to inspect.
+
+        Returns:
+            str | None: The raw token if the response sets it, otherwise ``None``.
+        """
+        for header in response.headers.get_list("set-cookie"):
+            name, _, value = header.partition("=")
+            if name.strip() == "XSRF-TOKEN":
+                return value.split(";", 1)[0]
+        return None
 
     async def _fetch_raw_token(self) -> str | None:
         """
         Fetch the raw XSRF token from the EmailNator API.
 
-        This method sends a GET request to the EmailNator base URL and
-        attempts to extract the ``XSRF-TOKEN`` from the response cookies.
+        When `config.XSRF_USE_HEAD` is enabled, a HEAD request is tried
+        first so the page body is not downloaded; its ``Set-Cookie`` header
+        is used if it carries the token. Otherwise, or if the HEAD request
+        fails with an `httpx.HTTPError` or an error status, a GET request
+        to the EmailNator base URL is sent. The token is read straight from
+        the ``Set-Cookie`` header of the response, falling back to the
+        client's cookie jar for the GET request.
 
         Returns:
-            str | None: The raw XSRF token if found in cookies, otherwise ``None``.
+            str | None: The raw XSRF token if found, otherwise ``None``.
 
         Raises:
-            httpx.HTTPStatusError: If the response status code indicates an error.
+            httpx.HTTPStatusError: If the GET response status code indicates an error.
         """
-        response = await self._client.get(config.BASE_URL)
+        raw: str | None
+        if self._USE_HEAD:
+            try:
+                response = await self._client.head(
+                    self._BASE_URL,
+                    follow_redirects=True
+                )
+            except httpx.HTTPError as exc:
+                logger.debug("XSRF HEAD request failed: %r", exc)
+            else:
+                if response.is_success:
+                    raw = self._token_from_headers(response)
+                    if raw:
+                        return raw
+        response = await self._client.get(self._BASE_URL)
         response.raise_for_status()
-        return self._client.cookies.get("XSRF-TOKEN")
+        raw = self._token_from_headers(response)
+        return raw or self._client.cookies.get("XSRF-TOKEN")
 
-    async def _decode(self, raw: str) -> str:
+    @staticmethod
+    def _decode(raw: str) -> str:
         """
         Decode a raw token string.
 
-        This method URL-decodes the given raw token string.
+        This method URL-decodes the given raw token string. Tokens without
+        percent escapes are returned unchanged without calling `unquote`.
 
         Args:
             raw (str): The raw token string to decode.
@@ -107,68 +180,121 @@ class XsrfManager:
         Returns:
             str: The decoded token string.
         """
-        return urllib.parse.unquote(raw)
+        return _unquote(raw) if "%" in raw else raw
+
+    def _set_token(self, raw: str | None, error: str) -> None:
+        """
+        Decode a raw token and rebuild the request headers around it.
+
+        Args:
+            raw (str | None): The raw token read from the cookies.
+            error (str): Message of the `RuntimeError` raised when the
+                token is missing or decodes to an empty string.
+
+        Raises:
+            RuntimeError: If the raw or decoded token is empty.
+        """
+        token: str = self._decode(raw) if raw else ""
+        if not token:
+            raise RuntimeError(error)
+        headers: dict[str, str] = dict(self._STATIC_HEADERS)
+        headers["X-XSRF-TOKEN"] = token
+        self._headers = MappingProxyType(headers)
+        self._token = token
+        self._fetched_at = time.monotonic()
+
+    async def _initialize(self) -> None:
+        """
+        Fetch the first token and set up the authentication headers.
+
+        Raises:
+            RuntimeError: If the raw token could not be retrieved from cookies.
+        """
+        self._set_token(
+            await self._fetch_raw_token(),
+            "XSRF-TOKEN not found in cookies"
+        )
+
+    async def _refresh(self) -> None:
+        """
+        Fetch a new token and replace the authentication headers.
+
+        Raises:
+            RuntimeError: If the raw token could not be fetched or decoded.
+        """
+        self._set_token(
+            await self._fetch_raw_token(),
+            "Failed to refresh XSRF-TOKEN: no raw token received."
+        )
+
+    def _on_init_done(self, task: asyncio.Task[None]) -> None:
+        """
+        Forget a failed initialization so the next caller starts a new one.
+
+        Args:
+            task (asyncio.Task[None]): The finished initialization task.
+        """
+        if task.cancelled() or task.exception() is not None:
+            self._init_task = None
+
+    def _on_refresh_done(self, task: asyncio.Task[None]) -> None:
+        """
+        Clear the finished refresh so the next call starts a new one.
+
+        Args:
+            task (asyncio.Task[None]): The finished refresh task.
+        """
+        if not task.cancelled():
+            task.exception()
+        if self._refresh_task is task:
+            self._refresh_task = None
 
     async def ensure_token(self) -> None:
         """
         Ensure that an XSRF authentication token is available.
 
-        If no token is currently stored, this method acquires an asynchronous
-        lock to safely initialize it. A raw token is fetched and decoded,
-        after which the authentication headers are set up.
+        If no token is currently stored, the first caller starts an
+        initialization task and every concurrent caller awaits that same
+        task, so only one token fetch is made. A raw token is fetched and
+        decoded, after which the authentication headers are set up.
 
         Raises:
             RuntimeError: If the raw token could not be retrieved from cookies.
         """
-        if self._token is None:
-            async with self._lock:
-                if self._token is None:
-                    raw: str | None = await self._fetch_raw_token()
-                    if not raw:
-                        raise RuntimeError("XSRF-TOKEN not found in cookies")
-                    self._token = await self._decode(raw)
-                    self._headers = {
-                        "Content-Type": "application/json",
-                        "X-Requested-With": "XMLHttpRequest",
-                        "X-XSRF-TOKEN": self._token,
-                        "DNT": "1",
-                        "Referer": config.BASE_URL + "/",
-                        "User-Agent": config.USER_AGENT,
-                    }
+        if self._token is not None:
+            return
+        task: asyncio.Task[None] | None = self._init_task
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._initialize())
+            task.add_done_callback(self._on_init_done)
+            self._init_task = task
+        await asyncio.shield(task)
 
     async def refresh(self) -> None:
         """
         Refresh the XSRF authentication token.
 
-        This method acquires an asynchronous lock to ensure that only one
-        refresh operation is performed at a time. It fetches a new raw token,
+        Concurrent calls share one in-flight refresh task, so only one
+        refresh request is sent at a time. It fetches a new raw token,
         decodes it, and updates the internal authentication headers.
 
         Raises:
             RuntimeError: If the raw token could not be fetched or decoded.
         """
-        async with self._lock:
-            raw: str | None = await self._fetch_raw_token()
-            if not raw:
-                raise RuntimeError(
-                    "Failed to refresh XSRF-TOKEN: no raw token received."
-                )
-
-            self._token = await self._decode(raw)
-            if not self._token:
-                raise RuntimeError(
-                    "Failed to refresh XSRF-TOKEN: decoding returned empty token."
-                )
-
-            self._headers["X-XSRF-TOKEN"] = self._token
+        task: asyncio.Task[None] | None = self._refresh_task
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._refresh())
+            self._refresh_task = task
+            task.add_done_callback(self._on_refresh_done)
+        await asyncio.shield(task)
 
     async def get_token(self) -> str:
         """
         Retrieve the current authentication token.
 
-        This method ensures that a valid token is available by calling
-        `ensure_token()`. If no token is present after validation, an
-        error is raised.
+        Once a token has been obtained it is returned directly; otherwise
+        `ensure_token()` is awaited first. If no token is present after
+        validation, an error is raised.
 
         Returns:
             str: The current authentication token.
@@ -176,21 +302,44 @@ class XsrfManager:
         Raises:
             RuntimeError: If the token could not be obtained.
         """
-        await self.ensure_token()
         if self._token is None:
-            raise RuntimeError("Failed to obtain authentication token.")
+            await self.ensure_token()
+            if self._token is None:
+                raise RuntimeError("Failed to obtain authentication token.")
         return self._token
 
+    async def get_headers_view(self) -> Mapping[str, str]:
+        """
+        Retrieve the current request headers as a read-only mapping.
+
+        This method ensures that a valid XSRF token is available before
+        returning the headers, awaiting `ensure_token()` only while no token
+        has been obtained yet. A token older than `token_max_age` seconds
+        is refreshed first; if that refresh fails, the warning is logged
+        and the previous headers are returned. Each new token replaces the
+        mapping with a new object, so callers should fetch it per request
+        rather than keep it.
+
+        Returns:
+            Mapping[str, str]: The current request headers.
+        """
+        if self._token is None:
+            await self.ensure_token()
+        elif time.monotonic() - self._fetched_at >= self.token_max_age:
+            try:
+                await self.refresh()
+            except (httpx.HTTPError, RuntimeError) as exc:
+                logger.warning("XSRF token refresh failed: %r", exc)
+        return self._headers
+
     async def get_headers(self) -> dict[str, str]:
         """
         Retrieve a copy of the current request headers.
 
-        This method ensures that a valid XSRF token is available before
-        returning the headers. The headers are returned as a shallow copy
-        to prevent external modifications from affecting the internal state.
+        Behaves like `get_headers_view()`, but returns a shallow copy that
+        callers may modify without affecting the internal state.
 
         Returns:
             dict[str, str]: A copy of the current request headers.
         """
-        await self.ensure_token()
-        return self._headers.copy()
+        return dict(await self.get_headers_view())
@@ -26,6 +26,10 @@ addresses. It offers methods to:
     - Generate a single temporary email address.
     - Generate multiple temporary email addresses (limited to `"100"`, `"200"`, or `"300"`).
     - Retrieve messages associated with a given email address.
+    - Find the messages of one or many senders in a message list.
+
+Looking up many senders at once uses an Aho-Corasick automaton when the
+optional ``pyahocorasick`` package is installed.
 
 Typical usage example:
     from emailnator.asyncio.email_generator import AsyncEmailGenerator
@@ -36,15 +40,80 @@ Typical usage example:
         messages = await generator.get_messages(email)
         print(email, messages)
 """
+import asyncio
 import re
+import time
 
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Literal
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
 from emailnator.asyncio.generators import Generators
 from emailnator.asyncio.helpers.metaclass import AsyncInitMeta
 from emailnator.asyncio.message_getter import MessageGetter
 
 
+@lru_cache(maxsize=256)
+def _sender_pattern(sender: str) -> re.Pattern[str]:
+    """
+    Return the compiled, case-insensitive pattern matching `sender`.
+
+    Patterns are memoized for the most recently used senders.
+
+    Args:
+        sender (str): Email address or name of the sender.
+
+    Returns:
+        re.Pattern[str]: A pattern that finds `sender` literally,
+        ignoring case, anywhere in a 'from' field.
+    """
+    return re.compile(re.escape(sender), re.IGNORECASE)
+from emailnator.helpers.validation import is_list_of
+
+
+_ALLOWED_BULK: frozenset[str] = frozenset(("100", "200", "300"))
+
+
+class _Email(str):
+    """
+    An email address that has already passed `_is_valid_email`.
+
+    Produced by `AsyncEmailGenerator._validate_email` and passed between
+    the generator's internal helpers, so an address is validated once per
+    call. It is never returned from the public API.
+    """
+    __slots__ = ()
+
+
+def _is_valid_email(email: str) -> bool:
+    """
+    Check that `email` looks like ``local@domain.tld``.
+
+    Accepts the same addresses as the pattern
+    ``^[^@\\s]+@[^@\\s]+\\.[a-zA-Z0-9]+$``: exactly one "@", no whitespace,
+    a non-empty local part and domain, and an ASCII alphanumeric TLD after
+    the last dot. Implemented with string methods to avoid running the
+    regex engine on every call.
+
+    Args:
+        email (str): The email address to check.
+
+    Returns:
+        bool: True if the address is well-formed, otherwise False.
+    """
+    at: int = email.find("@")
+    dot: int = email.rfind(".")
+    if at < 1 or dot <= at + 1 or "@" in email[at + 1:]:
+        return False
+    tld: str = email[dot + 1:]
+    return tld.isalnum() and tld.isascii() and email.split() == [email]
+
+
 class AsyncEmailGenerator(metaclass=AsyncInitMeta):
     """
     Asynchronous wrapper for generating temporary email addresses
@@ -58,7 +127,14 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
         - The underlying generator instance used to create email addresses.
         message_getter (MessageGetter): 
         - The instance responsible for retrieving messages linked to emails.
+        _index_cache (OrderedDict[str, tuple[float, dict[str, str]]]):
+        - Sender indexes built by `get_messages_index`, keyed by email,
+        - with the time they were built, in LRU order.
+        index_cache_size (int):
+        - Maximum number of mailboxes kept in `_index_cache`.
     """
+    index_cache_size: int = 64
+
     async def __ainit__(self) -> None:
         """
         Initialize the asynchronous email generator.
@@ -68,6 +144,62 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
         """
         self._generators: Generators = await Generators()
         self._message_getter: MessageGetter = await MessageGetter()
+        self._index_cache: OrderedDict[
+            str, tuple[float, dict[str, str]]
+        ] = OrderedDict()
+
+    @staticmethod
+    def _validate_email(email: str) -> _Email:
+        """
+        Check that `email` is a non-empty, well-formed email address.
+
+        Addresses already wrapped in `_Email` are returned without being
+        checked again.
+
+        Args:
+            email (str): The email address to validate.
+
+        Returns:
+            _Email: The validated email address.
+
+        Raises:
+            ValueError: If the email address is invalid or empty.
+        """
+        if type(email) is _Email:
+            return email
+
+        if not isinstance(email, str) or not email.strip():
+            raise ValueError("Email must be a non-empty string.")
+
+        if not _is_valid_email(email):
+            raise ValueError(f"Invalid email format: {email}")
+
+        return _Email(email)
+
+    async def _get_messages_raw(self, email: str) -> list[dict[str, str]]:
+        """
+        Retrieve the message list of an already validated email address.
+
+        Args:
+            email (str): A validated email address.
+
+        Returns:
+            list[dict[str, str]]: The message list returned by the API.
+        """
+        return await self._message_getter.get_message_list(email)
+
+    async def _get_message_raw(self, email: str, message_id: str) -> str:
+        """
+        Retrieve one message of an already validated email address.
+
+        Args:
+            email (str): A validated email address.
+            message_id (str): A validated message identifier.
+
+        Returns:
+            str: The content of the message.
+        """
+        return await self._message_getter.get_message(email, message_id)
 
     async def generate_email(self) -> str:
         """
@@ -108,13 +240,78 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
             ValueError: If the provided email address is invalid or empty.
             RuntimeError: If message retrieval fails or the response is invalid.
         """
-        if not isinstance(email, str) or not email.strip():
-            raise ValueError("Email must be a non-empty string.")
+        self._validate_email(email)
 
-        if not re.match(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+$", email):
-            raise ValueError(f"Invalid email format: {email}")
+        return await self._get_messages_raw(email)
 
-        return await self._message_getter.get_message_list(email)
+    @staticmethod
+    def _index_by_sender(messages: list[dict[str, str]]) -> dict[str, str]:
+        """
+        Map each sender of `messages` to the ID of its first message.
+
+        Senders are lower-cased so lookups ignore case. Messages without a
+        'from' or 'messageID' field are skipped.
+
+        Args:
+            messages (list[dict[str, str]]): Messages as returned by `get_messages`.
+
+        Returns:
+            dict[str, str]: Lower-cased 'from' values mapped to message IDs.
+        """
+        index: dict[str, str] = {}
+        for msg in messages:
+            sender: str | None = msg.get("from")
+            message_id: str | None = msg.get("messageID")
+            if sender and message_id:
+                index.setdefault(sender.lower(), message_id)
+        return index
+
+    async def get_messages_index(
+        self,
+        email: str,
+        ttl: float = 0,
+    ) -> dict[str, str]:
+        """
+        Asynchronously retrieve a sender-to-messageID index of a mailbox.
+
+        Useful when probing several senders against the same inbox: the
+        message list is fetched and indexed once, after which every lookup
+        is a single dictionary access.
+
+        Keys are the complete 'from' fields in lower case (e.g.
+        "ai tools <news@aitools.com>"), so a lookup only succeeds for the
+        exact, full sender string. Unlike `parse_message_from_sender`, a
+        name or address alone ("ai tools", "news@aitools.com") does not
+        match; use that method for partial sender matches.
+
+        Args:
+            email (str): The email address for which to index messages.
+            ttl (float, optional): Seconds to reuse a previously built index
+                for the same email, at most `index_cache_size` mailboxes.
+                Defaults to 0, which always refetches so new mail is seen.
+
+        Returns:
+            dict[str, str]: Lower-cased senders mapped to the ID of their
+            first message.
+
+        Raises:
+            ValueError: If the provided email address is invalid or empty.
+            RuntimeError: If message retrieval fails or the response is invalid.
+        """
+        cached: tuple[float, dict[str, str]] | None = self._index_cache.get(email)
+        if ttl > 0 and cached is not None and time.monotonic() - cached[0] < ttl:
+            self._index_cache.move_to_end(email)
+            return cached[1].copy()
+
+        index: dict[str, str] = self._index_by_sender(
+            await self.get_messages(email)
+        )
+        if ttl > 0:
+            self._index_cache[email] = (time.monotonic(), index)
+            self._index_cache.move_to_end(email)
+            if len(self._index_cache) > self.index_cache_size:
+                self._index_cache.popitem(last=False)
+        return index.copy()
 
     async def get_message(self, email: str, message_id: str) -> str:
         """
@@ -135,16 +332,61 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
             ValueError: If the email or message_id is invalid or empty.
             RuntimeError: If message retrieval fails.
         """
-        if not isinstance(email, str) or not email.strip():
-            raise ValueError("Email must be a non-empty string.")
-
-        if not re.match(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+$", email):
-            raise ValueError(f"Invalid email format: {email}")
+        self._validate_email(email)
 
         if not isinstance(message_id, str) or not message_id.strip():
             raise ValueError("Message ID must be a non-empty string.")
 
-        return await self._message_getter.get_message(email, message_id)
+        return await self._get_message_raw(email, message_id)
+
+    async def get_messages_bulk(
+        self,
+        email: str,
+        message_ids: list[str],
+        max_concurrent: int = 10,
+    ) -> list[str | BaseException]:
+        """
+        Asynchronously retrieve several messages of one mailbox concurrently.
+
+        Fetches every message in `message_ids` at once over the shared
+        connection pool, with at most `max_concurrent` requests in flight.
+        A failed fetch does not cancel the others; its exception is returned
+        in place of the message content.
+
+        Args:
+            email (str): The email address associated with the messages.
+            message_ids (list[str]): Identifiers of the messages to fetch.
+            max_concurrent (int, optional): Maximum number of requests in
+                flight. Defaults to 10.
+
+        Returns:
+            list[str | BaseException]: Message contents (or the exception
+            raised while fetching them), in the order of `message_ids`.
+
+        Raises:
+            ValueError: If the email or any message ID is invalid or empty,
+                or if `max_concurrent` is less than 1.
+        """
+        self._validate_email(email)
+
+        if not isinstance(message_ids, list) or not all(
+            isinstance(m, str) and m.strip() for m in message_ids
+        ):
+            raise ValueError("Message IDs must be a list of non-empty strings.")
+
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be a positive integer.")
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def fetch(message_id: str) -> str:
+            async with semaphore:
+                return await self._get_message_raw(email, message_id)
+
+        return await asyncio.gather(
+            *(fetch(message_id) for message_id in message_ids),
+            return_exceptions=True
+        )
 
     async def generate_bulk_emails(
         self,
@@ -170,7 +412,7 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
             ValueError: If `emails_number` is not one of the supported values.
             RuntimeError: If the generator fails to return a valid list of emails.
         """
-        if emails_number not in {"100", "200", "300"}:
+        if emails_number not in _ALLOWED_BULK:
             raise ValueError(
                 f"Invalid emails_number '{emails_number}'. Must be one of '100', '200', or '300'."
             )
@@ -179,9 +421,7 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
             emails_number
         )
 
-        if not isinstance(emails, list) or not all(
-            isinstance(e, str) for e in emails
-        ):
+        if not is_list_of(emails, str):
             raise RuntimeError("Email generator returned invalid data type.")
 
         if not emails:
@@ -197,6 +437,9 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
         """
         Parses a list of messages and retrieves the messageID of a message sent by a specific sender.
 
+        A message matches when `sender` appears in its 'from' field, ignoring
+        case (e.g. "AI TOOLS" matches "AI Tools <news@aitools.com>").
+
         Args:
             messages (list[dict[str, str]]): List of messages, each being a dictionary with at least 'from' and 'messageID' keys.
             sender (str): Email address or name of the sender to search for. Must be a non-empty string.
@@ -207,21 +450,78 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
         Raises:
             ValueError: If `messages` is not a list of dicts or if `sender` is invalid.
         """
-        if not isinstance(messages, list) or not all(isinstance(m, dict) for m in messages):
+        if not is_list_of(messages, dict):
             raise ValueError("Messages must be a list of dictionaries.")
 
         if not sender or not isinstance(sender, str):
             raise ValueError("Sender must be a non-empty string.")
 
-        message = next(
-            (msg for msg in messages if msg.get('from') == sender),
-            None
-        )
-        if message:
-            message_id = message.get("messageID")
-            return message_id
+        search = _sender_pattern(sender).search
+        for msg in messages:
+            if search(msg.get("from", "")):
+                return msg.get("messageID")
         return None
 
+    async def parse_messages_from_senders(
+        self,
+        messages: list[dict[str, str]],
+        senders: list[str],
+    ) -> dict[str, str | None]:
+        """
+        Find the messageID of the first message of each of several senders.
+
+        Senders are matched as in `parse_message_from_sender`, but all of
+        them are looked up in a single pass over `messages`. With the
+        optional ``pyahocorasick`` package every 'from' field is scanned once
+        for all senders; otherwise each sender still stops being searched
+        for as soon as it is found.
+
+        Args:
+            messages (list[dict[str, str]]): List of messages, each being a dictionary with at least 'from' and 'messageID' keys.
+            senders (list[str]): Email addresses or names of the senders to search for. Each must be a non-empty string.
+
+        Returns:
+            dict[str, str | None]: Every sender mapped to the messageID of its
+            first message, or None if no message from it was found.
+
+        Raises:
+            ValueError: If `messages` is not a list of dicts or if `senders` is invalid.
+        """
+        if not is_list_of(messages, dict):
+            raise ValueError("Messages must be a list of dictionaries.")
+
+        if not isinstance(senders, list) or not all(
+            sender and isinstance(sender, str) for sender in senders
+        ):
+            raise ValueError("Senders must be a list of non-empty strings.")
+
+        found: dict[str, str | None] = {}
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for sender in senders:
+                key: str = sender.lower()
+                if key not in automaton:
+                    automaton.add_word(key, key)
+            automaton.make_automaton()
+
+            for msg in messages:
+                for _, key in automaton.iter(msg.get("from", "").lower()):
+                    if key not in found:
+                        found[key] = msg.get("messageID")
+            return {sender: found.get(sender.lower()) for sender in senders}
+
+        pending: dict[str, re.Pattern[str]] = {
+            sender: _sender_pattern(sender) for sender in senders
+        }
+        for msg in messages:
+            if not pending:
+                break
+            from_field: str = msg.get("from", "")
+            for sender in [s for s, p in pending.items() if p.search(from_field)]:
+                found[sender] = msg.get("messageID")
+                del pending[sender]
+        return {sender: found.get(sender) for sender in senders}
+
     async def get_message_from_sender(
             self,
             sender: str,
@@ -230,6 +530,8 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
         """
         Retrieves the full text of the first message sent by a specific sender to a given email.
 
+        Senders are matched as in `parse_message_from_sender`.
+
         Args:
             sender (str): Email address or name of the sender to search for. Must be a non-empty string.
             email (str): The target email address. Must be a non-empty string.
@@ -244,22 +546,18 @@ class AsyncEmailGenerator(metaclass=AsyncInitMeta):
         if not sender or not isinstance(sender, str):
             raise ValueError("Sender must be a non-empty string.")
 
-        if not email or not isinstance(email, str):
-            raise ValueError("Email must be a non-empty string.")
+        email = self._validate_email(email)
 
-        messages = await self.get_messages(email)
-        if not isinstance(messages, list) or not all(isinstance(m, dict) for m in messages):
-            raise ValueError("get_messages() must return a list of dictionaries.")
+        messages = await self._get_messages_raw(email)
+        if not is_list_of(messages, dict):
+            raise ValueError("Message list must be a list of dictionaries.")
 
-        message = next(
-            (msg for msg in messages if msg.get('from') == sender),
-            None
-        )
-        if message:
-            message_id = message.get("messageID")
-            if not message_id:
-                return None
-            text = await self.get_message(email, message_id)
-            return text
+        search = _sender_pattern(sender).search
+        for msg in messages:
+            if search(msg.get("from", "")):
+                message_id = msg.get("messageID")
+                if not message_id:
+                    return None
+                return await self._get_message_raw(email, message_id)
 
         return None
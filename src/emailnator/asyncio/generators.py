@@ -21,7 +21,9 @@ EmailNator API Client
 
 This module provides a wrapper around the EmailNator API, facilitating the
 generation of single or bulk email addresses. It includes utility functions
-for handling HTTP requests and parsing JSON responses.
+for handling HTTP requests and parsing JSON responses. With
+`Generators.batch_requests` enabled, concurrent single-email requests are
+coalesced into bulk requests.
 
 
 Typical Usage Example:
@@ -33,15 +35,53 @@ Typical Usage Example:
         options=['dotGmail', 'plusGmail'], '5'
     )
     ['example1@gmail.com', 'example2@gmail.com', 'example3@gmail.com', 'example4@gmail.com', 'example5@gmail.com']
+    await generator.generate_many_bulk(3, "100")
+    ['example1@gmail.com', ..., 'example300@gmail.com']
 """
+import asyncio
+import time
 import httpx
 
-from typing import Literal
+from collections import deque
+from typing import Literal, Mapping, Sequence
 
 from emailnator.asyncio.helpers.metaclass import AsyncInitMeta
+from emailnator.asyncio.helpers.rate_limiter import (
+    AsyncRateLimiter,
+    get_host_limiter,
+)
 from emailnator.config.config import config
-from emailnator.asyncio.helpers.parser import Parser
+from emailnator.asyncio.helpers.parser import parse_email_response
+from emailnator.asyncio.builders.backends import ClientBackend
 from emailnator.asyncio.builders.builders import AsyncEmailnatorClient
+from emailnator.helpers.serialization import json_dumps
+from emailnator.helpers import logger
+
+
+_GENERATE_EMAIL_ENDPOINT: str = "/generate-email"
+_GENERATE_EMAIL_URL: str = config.BASE_URL + _GENERATE_EMAIL_ENDPOINT
+_DEFAULT_BODY: bytes = json_dumps({"email": config.GMAIL_CONFIG})
+_BULK_BODIES: dict[str, bytes] = {
+    size: json_dumps({"email": config.GMAIL_CONFIG, "emailNo": size})
+    for size in ("100", "200", "300")
+}
+
+
+class _PendingBatch:
+    """
+    Callers waiting on one coalesced `/generate-email` request.
+
+    Attributes:
+        options (Sequence[str]): Generation options shared by all waiters.
+        base_url (str): Base URL shared by all waiters.
+        items (list[asyncio.Future[list[str]]]): One future per waiting caller.
+        handle (asyncio.Handle | None): Scheduled flush of the batch.
+    """
+    def __init__(self, options: Sequence[str], base_url: str) -> None:
+        self.options: Sequence[str] = options
+        self.base_url: str = base_url
+        self.items: list[asyncio.Future[list[str]]] = []
+        self.handle: asyncio.Handle | None = None
 
 
 class Generators(metaclass=AsyncInitMeta):
@@ -53,43 +93,113 @@ class Generators(metaclass=AsyncInitMeta):
     headers, and helper functions for parsing API responses.
 
     Attributes:
-        parser (Parser): Parser for processing data.
         client (httpx.AsyncClient): Asynchronous HTTP client.
-        headers (dict): HTTP headers for requests.
+        backend (ClientBackend): HTTP backend used to send requests.
+        headers (Mapping[str, str]): Read-only HTTP headers of the latest
+            request, re-read from the Emailnator client before each request
+            so a refreshed XSRF token is picked up.
+        _emailnator_client (AsyncEmailnatorClient): Source of the headers.
+        _cache (dict[tuple, tuple[float, list[str]]]): Parsed responses
+            keyed by request parameters, with the time they were stored.
+        _batches (dict[tuple, _PendingBatch]): Open `generate_email` batches
+            keyed by options and base URL.
+        _spare (dict[tuple, deque[str]]): Addresses left over from bulk
+            requests made for batches, keyed by options and base URL.
+        batch_requests (bool): Whether concurrent `generate_email` calls are
+            coalesced into bulk requests. Off by default.
+        batch_max_size (int): Number of waiting callers that flushes a batch
+            immediately.
+        batch_bulk_threshold (int): Smallest number of waiting callers served
+            by one bulk request; smaller batches use single-email requests.
+        batch_bulk_size (Literal["100", "200", "300"]): Number of addresses
+            requested by a batch's bulk request.
     """
+    batch_requests: bool = False
+    batch_max_size: int = 50
+    batch_bulk_threshold: int = 5
+    batch_bulk_size: Literal["100", "200", "300"] = "100"
+
     async def __ainit__(self) -> None:
         """
         Initializes the asynchronous instance.
 
         This method performs asynchronous setup of dependencies:
-        creates a parser, initializes the asynchronous Emailnator client,
-        and configures HTTP headers.
+        initializes the asynchronous Emailnator client and configures HTTP
+        headers.
 
         Returns:
             None: This method does not return a value.
         """
-        self.parser: Parser = Parser()
         emailnator_client: AsyncEmailnatorClient = (
             await AsyncEmailnatorClient()
         )
         self.client: httpx.AsyncClient = await emailnator_client.get_client()
-        self.headers: dict = await emailnator_client.get_headers()
+        self.backend: ClientBackend = await emailnator_client.get_backend()
+        self._emailnator_client: AsyncEmailnatorClient = emailnator_client
+        self.headers: Mapping[str, str] = (
+            await emailnator_client.get_headers_view()
+        )
+        self._cache: dict[tuple, tuple[float, list[str]]] = {}
+        self._batches: dict[tuple, _PendingBatch] = {}
+        self._spare: dict[tuple, deque[str]] = {}
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        assert self.backend is not None, "No backend"
+
+    def _get_cached(self, key: tuple, ttl: float) -> list[str] | None:
+        """
+        Return a copy of a cached result if it is younger than `ttl` seconds.
+
+        Args:
+            key (tuple): Cache key built from the request parameters.
+            ttl (float): Maximum age of the cached entry, in seconds.
+
+        Returns:
+            list[str] | None: The cached emails, or None on a miss.
+        """
+        if ttl <= 0:
+            return None
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= ttl:
+            return None
+        return list(entry[1])
+
+    def _store_cached(self, key: tuple, ttl: float, emails: list[str]) -> None:
+        """
+        Store a parsed result in the cache when caching is enabled.
+
+        Args:
+            key (tuple): Cache key built from the request parameters.
+            ttl (float): Cache lifetime requested by the caller, in seconds.
+            emails (list[str]): The parsed emails to store.
+        """
+        if ttl > 0:
+            self._cache[key] = (time.monotonic(), list(emails))
 
     async def generate_email(
         self,
-        options: list[str] = config.GMAIL_CONFIG,
+        options: Sequence[str] = config.GMAIL_CONFIG,
         base_url: str = config.BASE_URL,
+        ttl: float = 0,
     ) -> list[str]:
         """
         Generate a single email address via the API.
 
-        Sends a POST request to the `/generate-email` endpoint with default
-        Gmail options (from `config.GMAIL_CONFIG`). Uses `parse_json_response`
-        to validate the response and return the parsed JSON.
+        Sends a single-email request with default Gmail options (from
+        `config.GMAIL_CONFIG`). When `batch_requests` is enabled and `ttl` is
+        0, concurrent calls with the same options are coalesced instead:
+        callers made in the same event loop iteration join one batch, which
+        is flushed on the next iteration or once `batch_max_size` callers
+        are waiting. Callers are first served from addresses left over by
+        earlier bulk requests. If at least `batch_bulk_threshold` callers
+        remain, one bulk request for `batch_bulk_size` addresses serves them
+        and the surplus is kept for later callers; otherwise they get
+        single-email requests.
 
         Args:
-            options (list[str]): A list of options to customize email generation.
+            options (Sequence[str]): A list of options to customize email generation.
             base_url (str, optional): Base URL of the API. Defaults to `config.BASE_URL`.
+            ttl (float, optional): Seconds to reuse a previous result for the
+                same options instead of calling the API. Defaults to 0 (no caching).
 
         Returns:
             list[str]: A writed JSON response containing the generated email.
@@ -98,25 +208,229 @@ class Generators(metaclass=AsyncInitMeta):
             RuntimeError: If the API response indicates an error (status != 200) 
                         or if the response is not valid JSON.
         """
+        cache_key: tuple = (tuple(options), None, base_url)
+        cached: list[str] | None = self._get_cached(cache_key, ttl)
+        if cached is not None:
+            return cached
+
+        if ttl > 0 or not self.batch_requests:
+            emails: list[str] = await self._request_email(options, base_url)
+            self._store_cached(cache_key, ttl, emails)
+            return emails
+
+        batch_key: tuple = (tuple(options), base_url)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        batch: _PendingBatch | None = self._batches.get(batch_key)
+        if batch is None:
+            batch = _PendingBatch(options, base_url)
+            batch.handle = loop.call_soon(self._flush_batch, batch_key)
+            self._batches[batch_key] = batch
+
+        waiter: asyncio.Future[list[str]] = loop.create_future()
+        batch.items.append(waiter)
+        if len(batch.items) >= self.batch_max_size:
+            self._flush_batch(batch_key)
+
+        return await waiter
+
+    async def _post(self, url: str, body: bytes) -> httpx.Response:
+        """
+        Send a rate-limited POST request, retrying on HTTP 429.
+
+        When `config.RATE_LIMIT` is positive, waits for the limiter shared
+        by all requests to the same host before every attempt. The headers
+        are read from the Emailnator client per attempt, so an XSRF token
+        refreshed after `token_max_age` is sent. A
+        response with status 429 is retried up to `config.MAX_RETRIES`
+        times after the delay given in its `Retry-After` header
+        (2 seconds when the header is missing or not a number).
+
+        Args:
+            url (str): Full URL of the endpoint.
+            body (bytes): Encoded JSON request body.
+
+        Returns:
+            httpx.Response: The last response received from the API.
+        """
+        attempt: int = 0
+        limiter: AsyncRateLimiter | None = get_host_limiter(
+            url,
+            config.RATE_LIMIT
+        )
+        while True:
+            if limiter is not None:
+                await limiter.acquire()
+            self.headers = await self._emailnator_client.get_headers_view()
+            response: httpx.Response = await self.backend.post(
+                url,
+                headers=self.headers,
+                content=body
+            )
+            if response.status_code != 429 or attempt >= config.MAX_RETRIES:
+                return response
+            attempt += 1
+            try:
+                retry_after: float = float(
+                    response.headers.get("Retry-After", 2)
+                )
+            except ValueError:
+                retry_after = 2
+            logger.warning(
+                "Rate limited by %s, retrying in %ss (%s/%s)",
+                url,
+                retry_after,
+                attempt,
+                config.MAX_RETRIES
+            )
+            await asyncio.sleep(max(retry_after, 0))
+
+    async def _request_email(
+        self,
+        options: Sequence[str],
+        base_url: str,
+    ) -> list[str]:
+        """
+        Send a single-email request to the `/generate-email` endpoint.
+
+        Args:
+            options (Sequence[str]): A list of options to customize email generation.
+            base_url (str): Base URL of the API.
+
+        Returns:
+            list[str]: The parsed response containing the generated email.
+
+        Raises:
+            RuntimeError: If the API response indicates an error or is not valid JSON.
+        """
         email_key: str = "email"
-        generation_endpoint: str = "/generate-email"
-        assert self.client is not None, "No client"
-        response: httpx.Response = await self.client.post(
-            base_url + generation_endpoint,
-            headers=self.headers,
-            json={email_key: options}
+        url: str = (
+            _GENERATE_EMAIL_URL if base_url == config.BASE_URL
+            else base_url + _GENERATE_EMAIL_ENDPOINT
         )
-        assert self.parser is not None, "No helpers"
-        return await self.parser.parse_email_response(
+        body: bytes = (
+            _DEFAULT_BODY if options is config.GMAIL_CONFIG
+            else json_dumps({email_key: options})
+        )
+        response: httpx.Response = await self._post(url, body)
+        return parse_email_response(
             response,
             "generate-email"
         )
 
+    def _flush_batch(self, batch_key: tuple) -> None:
+        """
+        Close the open batch for `batch_key` and start serving its callers.
+
+        Args:
+            batch_key (tuple): Key of the batch to flush.
+        """
+        batch: _PendingBatch | None = self._batches.pop(batch_key, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(
+            self._run_batch(batch)
+        )
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _run_batch(self, batch: _PendingBatch) -> None:
+        """
+        Serve every caller of a flushed batch.
+
+        Callers are first given addresses left over from earlier bulk
+        requests. If at least `batch_bulk_threshold` callers remain, one
+        bulk request for `batch_bulk_size` addresses serves them and the
+        surplus is kept for later batches; otherwise single requests are
+        used. Callers left without an address after the bulk request fall
+        back to single requests. Errors are propagated to the callers they
+        affect.
+
+        Args:
+            batch (_PendingBatch): The flushed batch.
+        """
+        batch_key: tuple = (tuple(batch.options), batch.base_url)
+        waiters: list[asyncio.Future[list[str]]] = self._hand_out(
+            batch_key,
+            batch.items
+        )
+        if len(waiters) >= max(self.batch_bulk_threshold, 2):
+            try:
+                emails: list[str] = await self._request_bulk(
+                    self.batch_bulk_size,
+                    batch.options,
+                    batch.base_url
+                )
+            except Exception as exc:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(exc)
+                return
+            self._spare.setdefault(batch_key, deque()).extend(emails)
+            waiters = self._hand_out(batch_key, waiters)
+
+        await asyncio.gather(
+            *(self._serve_single(waiter, batch) for waiter in waiters)
+        )
+
+    def _hand_out(
+        self,
+        batch_key: tuple,
+        waiters: list[asyncio.Future[list[str]]],
+    ) -> list[asyncio.Future[list[str]]]:
+        """
+        Resolve waiting callers with spare addresses while any are left.
+
+        Args:
+            batch_key (tuple): Options and base URL of the batch.
+            waiters (list[asyncio.Future[list[str]]]): The callers' futures.
+
+        Returns:
+            list[asyncio.Future[list[str]]]: Callers still waiting for an
+                address.
+        """
+        spare: deque[str] = self._spare.get(batch_key, deque())
+        pending: list[asyncio.Future[list[str]]] = []
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if spare:
+                waiter.set_result([spare.popleft()])
+            else:
+                pending.append(waiter)
+        return pending
+
+    async def _serve_single(
+        self,
+        waiter: asyncio.Future[list[str]],
+        batch: _PendingBatch,
+    ) -> None:
+        """
+        Resolve one waiting caller with a single-email request.
+
+        Args:
+            waiter (asyncio.Future[list[str]]): The caller's future.
+            batch (_PendingBatch): The batch the caller belongs to.
+        """
+        try:
+            emails: list[str] = await self._request_email(
+                batch.options,
+                batch.base_url
+            )
+        except Exception as exc:
+            if not waiter.done():
+                waiter.set_exception(exc)
+            return
+        if not waiter.done():
+            waiter.set_result(emails)
+
     async def generate_bulk_emails(
         self,
         emails_number: Literal["100", "200", "300"] = "100",
-        options: list[str] = config.GMAIL_CONFIG,
-        base_url: str = config.BASE_URL
+        options: Sequence[str] = config.GMAIL_CONFIG,
+        base_url: str = config.BASE_URL,
+        ttl: float = 0,
     ) -> list[str]:
         """
         Generate multiple email addresses via the API.
@@ -127,29 +441,116 @@ class Generators(metaclass=AsyncInitMeta):
 
         Args:
             emails_number (Literal["100", "200", "300"], optional): Number of emails to generate. Defaults to "100".
-            options (list[str]): A list of options to customize email generation.
+            options (Sequence[str]): A list of options to customize email generation.
             base_url (str, optional): Base URL of the API. Defaults to `config.BASE_URL`.
+            ttl (float, optional): Seconds to reuse a previous result for the
+                same options and count instead of calling the API. Defaults to 0 (no caching).
 
         Returns:
             list[str]: A writed JSON response containing generated emails.
 
+        Raises:
+            RuntimeError: If the API response indicates an error or is not valid JSON.
+        """
+        cache_key: tuple = (tuple(options), emails_number, base_url)
+        cached: list[str] | None = self._get_cached(cache_key, ttl)
+        if cached is not None:
+            return cached
+
+        emails: list[str] = await self._request_bulk(
+            emails_number,
+            options,
+            base_url
+        )
+        self._store_cached(cache_key, ttl, emails)
+        return emails
+
+    async def _request_bulk(
+        self,
+        emails_number: Literal["100", "200", "300"],
+        options: Sequence[str],
+        base_url: str,
+    ) -> list[str]:
+        """
+        Send a bulk request for `emails_number` addresses.
+
+        Args:
+            emails_number (Literal["100", "200", "300"]): Number of emails to generate.
+            options (Sequence[str]): A list of options to customize email generation.
+            base_url (str): Base URL of the API.
+
+        Returns:
+            list[str]: The parsed response containing the generated emails.
+
         Raises:
             RuntimeError: If the API response indicates an error or is not valid JSON.
         """
         email_key: str = "email"
         email_number_key: str = "emailNo"
-        generation_endpoint: str = "/generate-email"
-        assert self.client is not None, "No client"
-        response: httpx.Response = await self.client.post(
-            base_url + generation_endpoint,
-            headers=self.headers,
-            json={
+        url: str = (
+            _GENERATE_EMAIL_URL if base_url == config.BASE_URL
+            else base_url + _GENERATE_EMAIL_ENDPOINT
+        )
+        body: bytes | None = (
+            _BULK_BODIES.get(emails_number) if options is config.GMAIL_CONFIG
+            else None
+        )
+        if body is None:
+            body = json_dumps({
                 email_key: options,
                 email_number_key: emails_number
-            }
-        )
-        assert self.parser is not None, "No helpers"
-        return await self.parser.parse_email_response(
+            })
+        response: httpx.Response = await self._post(url, body)
+        return parse_email_response(
             response,
             "generate-email"
         )
+
+    async def generate_many_bulk(
+        self,
+        batches: int,
+        emails_number: Literal["100", "200", "300"] = "100",
+        options: Sequence[str] = config.GMAIL_CONFIG,
+        base_url: str = config.BASE_URL,
+        max_concurrent: int = 20,
+    ) -> list[str]:
+        """
+        Generate several batches of email addresses concurrently.
+
+        Issues `batches` bulk requests to the `/generate-email` endpoint at
+        once over the shared keep-alive connection pool, with at most
+        `max_concurrent` requests in flight, and flattens the results.
+
+        Args:
+            batches (int): Number of bulk requests to send.
+            emails_number (Literal["100", "200", "300"], optional): Number of emails per batch. Defaults to "100".
+            options (Sequence[str]): A list of options to customize email generation.
+            base_url (str, optional): Base URL of the API. Defaults to `config.BASE_URL`.
+            max_concurrent (int, optional): Maximum number of requests in flight. Defaults to 20.
+
+        Returns:
+            list[str]: Generated emails from all batches, in batch order.
+
+        Raises:
+            ValueError: If `batches` or `max_concurrent` is less than 1.
+            RuntimeError: If any API response indicates an error or is not valid JSON.
+        """
+        if batches < 1:
+            raise ValueError("batches must be a positive integer.")
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be a positive integer.")
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate_batch() -> list[str]:
+            async with semaphore:
+                return await self.generate_bulk_emails(
+                    emails_number,
+                    options,
+                    base_url
+                )
+
+        results: list[list[str]] = await asyncio.gather(
+            *(generate_batch() for _ in range(batches))
+        )
+        return [email for batch in results for email in batch]
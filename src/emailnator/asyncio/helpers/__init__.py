@@ -17,9 +17,21 @@
 # <https://www.gnu.org/licenses/>.
 
 from emailnator.asyncio.helpers.metaclass import AsyncInitMeta
-from emailnator.asyncio.helpers.parser import Parser
+from emailnator.asyncio.helpers.parser import (
+    Parser,
+    parse_email_response,
+    parse_message_response,
+)
+from emailnator.asyncio.helpers.rate_limiter import (
+    AsyncRateLimiter,
+    get_host_limiter,
+)
 
 __all__: tuple[str, ...] = (
     "AsyncInitMeta",
+    "AsyncRateLimiter",
     "Parser",
+    "get_host_limiter",
+    "parse_email_response",
+    "parse_message_response",
 )
@@ -38,18 +38,48 @@ Typical usage example:
 from typing import Any, Coroutine
 
 class AsyncInitMeta(type):
+    """
+    Metaclass that adds asynchronous initialization via `__ainit__`.
+
+    Constructor arguments are forwarded only to `__ainit__`; the regular
+    `__init__` is always called without arguments, so classes using this
+    metaclass must accept their parameters in `__ainit__`.
+
+    Attributes:
+        _has_ainit (bool): Whether the class defines or inherits `__ainit__`,
+            resolved once when the class is created.
+    """
+    def __init__(
+        cls,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        **kwargs: Any
+    ) -> None:
+        """
+        Initialize the class and cache whether it defines `__ainit__`.
+
+        Args:
+            name (str): Name of the class being created.
+            bases (tuple[type, ...]): Base classes of the class.
+            namespace (dict[str, Any]): Class body namespace.
+            **kwargs (Any): Extra class keyword arguments.
+        """
+        super().__init__(name, bases, namespace, **kwargs)
+        cls._has_ainit: bool = getattr(cls, "__ainit__", None) is not None
+
     def __call__(cls, *args: Any, **kwargs: Any) -> Coroutine[Any, Any, Any]:
         """
         Create an instance of a class with asynchronous initialization support.
 
         This method overrides the default metaclass `__call__` to allow
         asynchronous construction of objects. It wraps the normal instance
-        creation in a coroutine (`init_and_return`) that checks for and
-        awaits an `__ainit__` method if it exists.
+        creation in a coroutine (`init_and_return`) that awaits the
+        `__ainit__` method if the class defines one.
 
         Args:
-            *args (Any): Positional arguments forwarded to the class constructor.
-            **kwargs (Any): Keyword arguments forwarded to the class constructor.
+            *args (Any): Positional arguments forwarded to `__ainit__`.
+            **kwargs (Any): Keyword arguments forwarded to `__ainit__`.
 
         Returns:
             Coroutine[Any, Any, Any]: A coroutine that resolves to the fully
@@ -60,17 +90,17 @@ class AsyncInitMeta(type):
             Create and asynchronously initialize an instance of the class.
 
             This function first creates an instance of the class using the
-            standard constructor (`__init__` if defined). If the created
-            instance implements an asynchronous initializer (`__ainit__`),
-            it is awaited to complete additional setup. The fully
-            initialized instance is then returned.
+            standard constructor without arguments. If the class implements
+            an asynchronous initializer (`__ainit__`), it is awaited with the
+            constructor arguments to complete setup. The fully initialized
+            instance is then returned.
 
             Returns:
                 Any: The fully constructed and asynchronously initialized
                 instance of the class.
             """
-            self: Any = super(AsyncInitMeta, cls).__call__(*args, **kwargs)
-            if hasattr(self, "__ainit__"):
+            self: Any = super(AsyncInitMeta, cls).__call__()
+            if cls._has_ainit:
                 await self.__ainit__(*args, **kwargs)
             return self
         return init_and_return()
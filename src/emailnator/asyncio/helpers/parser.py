@@ -20,110 +20,138 @@
 Utility helper functions used across the project.
 
 This module provides stateless helper functions for general use. Currently,
-it exposes the `Parser` class with static methods to simplify common tasks,
-such as parsing HTTP responses safely as JSON.
+it exposes the module-level functions `parse_email_response` and
+`parse_message_response`, which parse HTTP responses safely as JSON. The
+`Parser` class groups the same functions as static methods for existing
+callers. Response bodies are decoded
+straight from the buffered `response.content` bytes, without building an
+intermediate text copy on the success path.
 
 Typical Usage Example:
     import httpx
-    from helpers import Helpers
-    resp = httpx.Response(200, content=b'{"key": ["value"]}')
-    Helpers.parse_email_response(resp, "get-items")
-    ['value']
+    from emailnator.asyncio.helpers.parser import parse_email_response
+    resp = httpx.Response(200, content=b'{"email": ["a@gmail.com"]}')
+    parse_email_response(resp, "generate-email")
+    ['a@gmail.com']
 """
 import httpx
 
 from typing import Any
 
+from emailnator.helpers.serialization import json_loads
+from emailnator.helpers.validation import is_list_of
+
+
+def _preview(response: httpx.Response, limit: int = 400) -> str:
+    """
+    Return the beginning of a response body for error messages.
+
+    Only the first `limit` bytes are decoded, so building an error message
+    never decodes (or runs charset detection on) the whole body.
+
+    Args:
+        response (httpx.Response): The response to preview.
+        limit (int, optional): Maximum number of bytes to decode. Defaults to 400.
+
+    Returns:
+        str: The decoded prefix of the body.
+    """
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+def parse_email_response(
+    response: httpx.Response,
+    context: str
+) -> list[str]:
+    """
+    Parse and extract email addresses from an HTTP JSON response.
+
+    This function validates the HTTP response and attempts to parse its content
+    as JSON. It expects the JSON to contain an "email" field, which should be a
+    list of strings (email addresses).
+
+    Args:
+        response (httpx.Response): The HTTP response object to parse.
+        context (str): A short description of the request context, used for
+            more informative error messages.
+
+    Returns:
+        list[str]: A list of email addresses extracted from the response.
+
+    Raises:
+        RuntimeError: If the response status code is 400 or higher.
+        RuntimeError: If the response content is not valid JSON.
+        RuntimeError: If the "email" field is missing or not a list of strings.
+    """
+    if response.status_code >= 400:
+        raise RuntimeError(f"{context} returned {response.status_code}: {_preview(response)}")
+
+    try:
+        data: Any = json_loads(response.content)
+    except ValueError:
+        raise RuntimeError(f"{context} response is not valid JSON: {_preview(response)}")
+
+    emails = data.get("email") if isinstance(data, dict) else None
+
+    if isinstance(emails, str):
+        return [emails]
+    if is_list_of(emails, str):
+        return emails
+
+    raise RuntimeError(f"{context} response does not contain valid 'email' data: {_preview(response)}")
+
+
+def parse_message_response(
+    response: httpx.Response,
+    context: str
+) -> list[dict[str, str]]:
+    """
+    Parse and validate a message list response from the API.
+
+    This function checks the HTTP response for errors and attempts to parse its
+    content as JSON. It extracts the "messageData" field, which is expected to
+    contain a list of message objects.
+
+    Args:
+        response (httpx.Response): The HTTP response object to parse.
+        context (str): Description of the request context, used in error messages.
+
+    Returns:
+        list[dict[str, str]]: A list of message dictionaries parsed from the response.
+
+    Raises:
+        RuntimeError: If the response has a status code >= 400.
+        RuntimeError: If the response body is not valid JSON.
+        RuntimeError: If the JSON structure does not contain a valid "messageData" list.
+    """
+    if response.status_code >= 400:
+        raise RuntimeError(f"{context} returned {response.status_code}: {_preview(response)}")
+
+    try:
+        data: Any = json_loads(response.content)
+    except ValueError:
+        raise RuntimeError(f"{context} response is not valid JSON: {_preview(response)}")
+
+    message_data = (
+        data.get("messageData") if isinstance(data, dict) else None
+    )
+
+    if not is_list_of(message_data, dict):
+        raise RuntimeError(f"{context} response does not contain valid 'messageData': {_preview(response)}")
+
+    return message_data
+
 
 class Parser:
     """
     Utility helpers used across the project.
 
-    A small container for stateless helper functions. Currently this class
-    exposes a static method `parse_json_response` that validates an httpx
-    response and returns its JSON payload, raising a `RuntimeError` for
-    HTTP errors (status >= 400) or invalid JSON.
+    A namespace kept for existing callers. It exposes the module-level
+    functions `parse_email_response` and `parse_message_response` as static
+    methods; new code should call the functions directly.
 
     Attributes:
         None
     """
-    @staticmethod
-    async def parse_email_response(
-        response: httpx.Response,
-        context: str
-    ) -> list[str]:
-        """
-        Parse and extract email addresses from an HTTP JSON response.
-
-        This coroutine validates the HTTP response and attempts to parse its content
-        as JSON. It expects the JSON to contain an "email" field, which should be a
-        list of strings (email addresses).
-
-        Args:
-            response (httpx.Response): The HTTP response object to parse.
-            context (str): A short description of the request context, used for
-                more informative error messages.
-
-        Returns:
-            list[str]: A list of email addresses extracted from the response.
-
-        Raises:
-            RuntimeError: If the response status code is 400 or higher.
-            RuntimeError: If the response content is not valid JSON.
-            RuntimeError: If the "email" field is missing or not a list of strings.
-        """
-        if response.status_code >= 400:
-            raise RuntimeError(f"{context} returned {response.status_code}: {response.text}")
-
-        try:
-            data: Any = response.json()
-        except ValueError:
-            raise RuntimeError(f"{context} response is not valid JSON: {response.text[:400]}")
-
-        emails = data.get("email")
-
-        if isinstance(emails, str):
-            return [emails]
-        if isinstance(emails, list) and all(isinstance(e, str) for e in emails):
-            return emails
-
-        raise RuntimeError(f"{context} response does not contain valid 'email' data: {response.text[:400]}")
-
-    @staticmethod
-    async def parse_message_response(
-        response: httpx.Response,
-        context: str
-    ) -> list[dict[str, str]]:
-        """
-        Parse and validate a message list response from the API.
-
-        This coroutine checks the HTTP response for errors and attempts to parse its
-        content as JSON. It extracts the "messageData" field, which is expected to
-        contain a list of message objects.
-
-        Args:
-            response (httpx.Response): The HTTP response object to parse.
-            context (str): Description of the request context, used in error messages.
-
-        Returns:
-            list[dict[str, str]]: A list of message dictionaries parsed from the response.
-
-        Raises:
-            RuntimeError: If the response has a status code >= 400.
-            RuntimeError: If the response body is not valid JSON.
-            RuntimeError: If the JSON structure does not contain a valid "messageData" list.
-        """
-        if response.status_code >= 400:
-            raise RuntimeError(f"{context} returned {response.status_code}: {response.text}")
-
-        try:
-            data: Any = response.json()
-        except ValueError:
-            raise RuntimeError(f"{context} response is not valid JSON: {response.text[:400]}")
-
-        message_data = data.get("messageData")
-
-        if not isinstance(message_data, list) or not all(isinstance(m, dict) for m in message_data):
-            raise RuntimeError(f"{context} response does not contain valid 'messageData': {response.text[:400]}")
-
-        return message_data
+    parse_email_response = staticmethod(parse_email_response)
+    parse_message_response = staticmethod(parse_message_response)
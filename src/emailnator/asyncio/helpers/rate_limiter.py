@@ -0,0 +1,143 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""
+Client-side rate limiting for EmailNator API requests.
+
+This module provides a token-bucket limiter that spaces out outgoing
+requests so the client stays under the server's rate limit instead of
+spending round-trips on responses rejected with HTTP 429. Limiters returned
+by `get_host_limiter` are shared process-wide per host, across instances,
+event loops and threads.
+
+Typical Usage Example:
+    limiter = get_host_limiter(url, 10)
+    if limiter is not None:
+        await limiter.acquire()
+    response = await client.post(url)
+"""
+import asyncio
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+
+_LIMITERS: dict[str, "AsyncRateLimiter"] = {}
+_LIMITERS_LOCK: threading.Lock = threading.Lock()
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to `rate` requests and refills at `rate` tokens
+    per `period` seconds. Callers that find the bucket empty reserve a
+    future token and sleep until it becomes available, so waiting
+    callers are released in arrival order.
+
+    Attributes:
+        rate (float): Number of requests allowed per period.
+        period (float): Length of the period, in seconds.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0) -> None:
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            rate (float): Number of requests allowed per period.
+            period (float, optional): Length of the period, in seconds.
+                Defaults to 1.0.
+
+        Raises:
+            ValueError: If `rate` or `period` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.rate: float = rate
+        self.period: float = period
+        self._tokens: float = rate
+        self._updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request may be sent.
+
+        The token is reserved under a lock before sleeping, so concurrent
+        callers never share a token, even from different event loops. A
+        caller cancelled while sleeping gives its token back.
+
+        Returns:
+            None: This method does not return a value.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                self.rate,
+                self._tokens + (now - self._updated) * self.rate / self.period
+            )
+            self._updated = now
+            self._tokens -= 1
+            tokens: float = self._tokens
+        if tokens < 0:
+            try:
+                await asyncio.sleep(-tokens * self.period / self.rate)
+            except asyncio.CancelledError:
+                with self._lock:
+                    self._tokens += 1
+                raise
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+def get_host_limiter(url: str, rate: float) -> AsyncRateLimiter | None:
+    """
+    Return the limiter shared by all requests to the host of `url`.
+
+    One limiter exists per host for the whole process, so every client
+    instance and event loop sending to that host draws from the same
+    bucket. A limiter is replaced when `rate` changes.
+
+    Args:
+        url (str): URL of the request.
+        rate (float): Number of requests allowed per second; 0 or less
+            disables limiting.
+
+    Returns:
+        AsyncRateLimiter | None: The shared limiter, or None when `rate`
+            is not positive.
+    """
+    if rate <= 0:
+        return None
+    host: str = urlsplit(url).netloc
+    limiter: AsyncRateLimiter | None = _LIMITERS.get(host)
+    if limiter is None or limiter.rate != rate:
+        with _LIMITERS_LOCK:
+            limiter = _LIMITERS.get(host)
+            if limiter is None or limiter.rate != rate:
+                limiter = _LIMITERS[host] = AsyncRateLimiter(rate)
+    return limiter
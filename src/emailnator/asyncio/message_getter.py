@@ -23,12 +23,26 @@ This module provides the `MessageGetter` class, which is a wrapper around the
 EmailNator API for fetching email messages. It uses an HTTP client from `httpx`
 and helper utilities from `Helpers` to parse API responses.
 """
+import asyncio
+import time
 import httpx
 
+from collections import OrderedDict
+from typing import Mapping
+
 from emailnator.config.config import config
-from emailnator.asyncio.helpers.parser import Parser
+from emailnator.helpers.serialization import json_dumps
+from emailnator.asyncio.helpers.parser import parse_message_response
 from emailnator.asyncio.builders.builders import AsyncEmailnatorClient
 from emailnator.asyncio.helpers.metaclass import AsyncInitMeta
+from emailnator.asyncio.helpers.rate_limiter import (
+    AsyncRateLimiter,
+    get_host_limiter,
+)
+
+
+_MESSAGE_LIST_ENDPOINT: str = "/message-list"
+_MESSAGE_LIST_URL: str = config.BASE_URL + _MESSAGE_LIST_ENDPOINT
 
 
 class MessageGetter(metaclass=AsyncInitMeta):
@@ -36,43 +50,87 @@ class MessageGetter(metaclass=AsyncInitMeta):
     Asynchronous client wrapper for retrieving messages from the EmailNator API.
 
     This class provides functionality to fetch the list of messages associated
-    with a given email address and parse the results using the `Parser` utility.
+    with a given email address and parse the results using the
+    `parse_message_response` helper.
 
     Attributes:
-        parser (Parser): Parser instance used to process API responses.
         client (httpx.AsyncClient): Asynchronous HTTP client for making requests
             to the EmailNator API.
-        headers (dict[str, str]): Default HTTP headers applied to all requests.
+        headers (httpx.Headers): Default HTTP headers applied to all requests,
+            encoded once per XSRF token so httpx does not re-validate them
+            per request.
+        _emailnator_client (AsyncEmailnatorClient): Source of the headers,
+            consulted before each request so a refreshed token is used.
+        _headers_source (Mapping[str, str]): The header mapping `headers`
+            was encoded from.
+        _inflight (dict[tuple[str, str], asyncio.Task[list[dict[str, str]]]]):
+            Message-list requests currently in flight, keyed by email and
+            base URL, shared by concurrent callers.
+        _list_cache (dict[tuple[str, str], tuple[float, list[dict[str, str]]]]):
+            Parsed message lists keyed by email and base URL, with the time
+            they were stored.
+        _message_cache (OrderedDict[tuple[str, str, str], tuple[bytes, str]]):
+            Message bodies and their text encodings keyed by email, message
+            ID and base URL, in LRU order.
+        message_cache_size (int): Maximum number of message bodies kept in
+            `_message_cache`.
+        max_concurrent_requests (int): Maximum number of `/message-list`
+            requests this getter sends at the same time.
+        _semaphore (asyncio.Semaphore): Bounds concurrent requests to
+            `max_concurrent_requests`.
     """
+    message_cache_size: int = 256
+    max_concurrent_requests: int = 16
+
     async def __ainit__(self) -> None:
         """
         Asynchronous initializer for the MessageGetter.
 
-        This method initializes the HTTP client, request headers, and parser
+        This method initializes the HTTP client and request headers
         required for interacting with the EmailNator API.
         """
         emailnator_client: AsyncEmailnatorClient = (
             await AsyncEmailnatorClient()
         )
-        self.parser: Parser = Parser()
         self.client: httpx.AsyncClient = await emailnator_client.get_client()
-        self.headers: dict = await emailnator_client.get_headers()
+        self._emailnator_client: AsyncEmailnatorClient = emailnator_client
+        self._headers_source: Mapping[str, str] = (
+            await emailnator_client.get_headers_view()
+        )
+        self.headers: httpx.Headers = httpx.Headers(self._headers_source)
+        self._inflight: dict[
+            tuple[str, str], asyncio.Task[list[dict[str, str]]]
+        ] = {}
+        self._list_cache: dict[
+            tuple[str, str], tuple[float, list[dict[str, str]]]
+        ] = {}
+        self._message_cache: OrderedDict[
+            tuple[str, str, str], tuple[bytes, str]
+        ] = OrderedDict()
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            self.max_concurrent_requests
+        )
 
     async def get_message_list(
         self,
         email: str,
         base_url: str = config.BASE_URL,
+        ttl: float = 0,
     ) -> list[dict[str, str]]:
         """
         Asynchronously retrieve a list of messages associated with the given email address.
 
         This coroutine sends a POST request to the `/message-list` endpoint to fetch
         metadata about messages linked to the specified email. The result is parsed
-        and returned as a list of message dictionaries.
+        and returned as a list of message dictionaries. Concurrent calls for the
+        same email share a single in-flight request, and with a positive `ttl`
+        a burst of polls is answered from the last parsed list.
 
         Args:
             email (str): The email address for which to fetch the message list.
             base_url (str, optional): The base URL of the API. Defaults to `config.BASE_URL`.
+            ttl (float, optional): Seconds to reuse a previously fetched list for
+                the same email instead of calling the API. Defaults to 0 (no caching).
 
         Returns:
             list[dict[str, str]]: A list of message metadata dictionaries. Each dictionary
@@ -84,16 +142,111 @@ class MessageGetter(metaclass=AsyncInitMeta):
             httpx.HTTPStatusError: If the HTTP response indicates a failed request.
             RuntimeError: If the response cannot be parsed or is missing expected data.
         """
-        get_messages_endpoint: str = "/message-list"
-        final_url: str = base_url + get_messages_endpoint
+        key: tuple[str, str] = (email, base_url)
+        if ttl > 0:
+            entry = self._list_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return list(entry[1])
 
-        assert self.client is not None, "No client"
-        response: httpx.Response = await self.client.post(
-            final_url,
-            headers=self.headers,
-            json={"email": email}
+        task: asyncio.Task[list[dict[str, str]]] | None = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch_message_list(email, base_url)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done: self._forget_inflight(key, done)
+            )
+        messages: list[dict[str, str]] = await asyncio.shield(task)
+        if ttl > 0:
+            self._list_cache[key] = (time.monotonic(), messages)
+        return list(messages)
+
+    def _forget_inflight(
+        self,
+        key: tuple[str, str],
+        task: asyncio.Task[list[dict[str, str]]],
+    ) -> None:
+        """
+        Remove a finished message-list request from the in-flight registry.
+
+        Args:
+            key (tuple[str, str]): Email and base URL of the request.
+            task (asyncio.Task[list[dict[str, str]]]): The finished request.
+        """
+        if not task.cancelled():
+            task.exception()
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _current_headers(self) -> httpx.Headers:
+        """
+        Return the encoded headers for the current XSRF token.
+
+        The headers are encoded again only when the Emailnator client hands
+        out a new mapping, i.e. after the token was refreshed.
+
+        Returns:
+            httpx.Headers: The headers to send with the next request.
+        """
+        source: Mapping[str, str] = (
+            await self._emailnator_client.get_headers_view()
+        )
+        if source is not self._headers_source:
+            self._headers_source = source
+            self.headers = httpx.Headers(source)
+        return self.headers
+
+    @staticmethod
+    async def _wait_for_rate_limit(url: str) -> None:
+        """
+        Wait for the limiter shared by all requests to the host of `url`.
+
+        Does nothing unless `config.RATE_LIMIT` is positive.
+
+        Args:
+            url (str): URL of the request about to be sent.
+        """
+        limiter: AsyncRateLimiter | None = get_host_limiter(
+            url,
+            config.RATE_LIMIT
+        )
+        if limiter is not None:
+            await limiter.acquire()
+
+    async def _fetch_message_list(
+        self,
+        email: str,
+        base_url: str,
+    ) -> list[dict[str, str]]:
+        """
+        Send one `/message-list` request and parse the returned messages.
+
+        Args:
+            email (str): The email address for which to fetch the message list.
+            base_url (str): The base URL of the API.
+
+        Returns:
+            list[dict[str, str]]: A list of message metadata dictionaries.
+
+        Raises:
+            RuntimeError: If the response cannot be parsed or is missing expected data.
+        """
+        final_url: str = (
+            _MESSAGE_LIST_URL if base_url == config.BASE_URL
+            else base_url + _MESSAGE_LIST_ENDPOINT
         )
-        return await self.parser.parse_message_response(response, "message-list")
+
+        assert self.client is not None, "No client"
+        await self._wait_for_rate_limit(final_url)
+        headers: httpx.Headers = await self._current_headers()
+        async with self._semaphore:
+            response: httpx.Response = await self.client.post(
+                final_url,
+                headers=headers,
+                content=json_dumps({"email": email})
+            )
+        return parse_message_response(response, "message-list")
 
     async def get_message(
         self,
@@ -105,8 +258,9 @@ class MessageGetter(metaclass=AsyncInitMeta):
         Asynchronously retrieve the full content of a specific email message from the API.
 
         This coroutine sends a POST request to the `/message-list` endpoint with the
-        given email and message ID, and returns the raw response text (typically the
-        HTML content of the message).
+        given email and message ID, and returns the response body (typically the
+        HTML content of the message) decoded with the charset the response
+        declares, as `httpx.Response.text` does.
 
         Args:
             email (str): The email address from which to retrieve the message.
@@ -121,16 +275,86 @@ class MessageGetter(metaclass=AsyncInitMeta):
             httpx.RequestError: If there is a network or connection issue.
             httpx.HTTPStatusError: If the response status code indicates an error.
         """
-        get_messages_endpoint: str = "/message-list"
-        final_url: str = base_url + get_messages_endpoint
+        body, encoding = await self._fetch_message(email, message_id, base_url)
+        return body.decode(encoding, "replace")
+
+    async def get_message_bytes(
+        self,
+        email: str,
+        message_id: str,
+        base_url: str = config.BASE_URL,
+    ) -> bytes:
+        """
+        Asynchronously retrieve the undecoded content of a specific email message.
+
+        The response body is read once as bytes without being decoded to
+        text, so callers that parse HTML from bytes can skip the decode
+        entirely. Message bodies never
+        change for a given ID, so successful responses are kept in a
+        least-recently-used cache of `message_cache_size` entries.
+
+        Args:
+            email (str): The email address from which to retrieve the message.
+            message_id (str): The unique identifier of the message to fetch.
+            base_url (str, optional): The base URL of the API. Defaults to `config.BASE_URL`.
+
+        Returns:
+            bytes: The raw message body as returned by the server (usually HTML).
+
+        Raises:
+            AssertionError: If the HTTP client (`self.client`) is not initialized.
+            httpx.RequestError: If there is a network or connection issue.
+            httpx.HTTPStatusError: If the response status code indicates an error.
+        """
+        body, _ = await self._fetch_message(email, message_id, base_url)
+        return body
+
+    async def _fetch_message(
+        self,
+        email: str,
+        message_id: str,
+        base_url: str,
+    ) -> tuple[bytes, str]:
+        """
+        Fetch a message body together with the encoding of its text.
+
+        Args:
+            email (str): The email address from which to retrieve the message.
+            message_id (str): The unique identifier of the message to fetch.
+            base_url (str): The base URL of the API.
+
+        Returns:
+            tuple[bytes, str]: The raw body and the encoding httpx would use
+                to decode it.
+        """
+        key: tuple[str, str, str] = (email, message_id, base_url)
+        cached: tuple[bytes, str] | None = self._message_cache.get(key)
+        if cached is not None:
+            self._message_cache.move_to_end(key)
+            return cached
+
+        final_url: str = (
+            _MESSAGE_LIST_URL if base_url == config.BASE_URL
+            else base_url + _MESSAGE_LIST_ENDPOINT
+        )
 
         assert self.client is not None, "No client"
-        response: httpx.Response = await self.client.post(
+        await self._wait_for_rate_limit(final_url)
+        headers: httpx.Headers = await self._current_headers()
+        async with self._semaphore, self.client.stream(
+            "POST",
             final_url,
-            headers=self.headers,
-            json={
+            headers=headers,
+            content=json_dumps({
                 "email": email,
                 "messageID": message_id
-            }
-        )
-        return response.text
+            })
+        ) as response:
+            body: bytes = await response.aread()
+
+        entry: tuple[bytes, str] = (body, response.encoding or "utf-8")
+        if response.is_success:
+            self._message_cache[key] = entry
+            if len(self._message_cache) > self.message_cache_size:
+                self._message_cache.popitem(last=False)
+        return entry
@@ -22,17 +22,33 @@ Configuration settings for the EmailNator client.
 This module provides functions to load configuration settings from a YAML
 file into a Config object. It includes settings for the API base URL,
 timeout, HTTP options, user agent, and Gmail-specific configuration.
-
+The file is parsed with the libyaml-backed ``CSafeLoader`` when PyYAML was
+built with it, and with the pure-Python ``SafeLoader`` otherwise. The
+module-level `config` object is loaded when the module is imported.
 
 Typical Usage Example:
     config = load_config()
     print(config.BASE_URL)
     'https://www.emailnator.com'
 """
-import yaml
+import os
 
+from importlib.resources import files
 from pathlib import Path
 
+from yaml import load as yaml_load
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _Loader
+
+try:
+    from importlib.resources.abc import Traversable
+except ImportError:  # pragma: no cover
+    from importlib.abc import Traversable
+from typing import Any
+
 from emailnator.config.helpers import format_gmail_config
 from emailnator.helpers.logger import logger
 
@@ -43,23 +59,61 @@ class Config:
 
     This class holds all constants and default settings required for
     interacting with the EmailNator API, including the base URL, timeout,
-    HTTP options, user agent, and Gmail-specific configuration.
+    HTTP options, user agent, and Gmail-specific configuration. Instances
+    use ``__slots__``, so they carry no per-instance ``__dict__`` and only
+    the attributes below can be set.
 
     Attributes:
         BASE_URL (str): Base URL of the EmailNator API.
         TIMEOUT (int): Default timeout for API requests, in seconds.
         USE_HTTP2 (bool): Whether to use HTTP/2 for requests.
         USER_AGENT (str): Default User-Agent header for HTTP requests.
-        GMAIL_CONFIG (list): Default options for generating Gmail addresses.
+        USER_AGENT_BYTES (bytes): `USER_AGENT` encoded once as ASCII, ready
+        - to be sent as a header value without per-request encoding.
+        GMAIL_CONFIG (list[str]): Default options for generating Gmail addresses.
         PROXY (str | None): Proxy address (e.g., "http://127.0.0.1:8080") or
         - ``None`` if no proxy is used.
+        MAX_CONN (int): Maximum number of connections in the HTTP pool.
+        MAX_KEEPALIVE (int): Maximum number of idle keep-alive connections.
+        HTTP_BACKEND (str): HTTP backend used for API requests,
+        - ``"httpx"`` (default) or ``"aiohttp"``.
+        RATE_LIMIT (float): Maximum number of API requests per second,
+        - ``0`` (default) disables client-side rate limiting.
+        MAX_RETRIES (int): How many times a request rejected with HTTP 429
+        - is retried after the server's ``Retry-After`` delay.
+        XSRF_USE_HEAD (bool): Whether to fetch the XSRF token with a HEAD
+        - request first, falling back to GET when it carries no token;
+        - ``False`` by default.
     """
+    __slots__ = (
+        "BASE_URL",
+        "TIMEOUT",
+        "USE_HTTP2",
+        "USER_AGENT",
+        "USER_AGENT_BYTES",
+        "GMAIL_CONFIG",
+        "PROXY",
+        "MAX_CONN",
+        "MAX_KEEPALIVE",
+        "HTTP_BACKEND",
+        "RATE_LIMIT",
+        "MAX_RETRIES",
+        "XSRF_USE_HEAD",
+    )
+
     BASE_URL: str
     TIMEOUT: int
     USE_HTTP2: bool
     USER_AGENT: str
-    GMAIL_CONFIG: list
+    USER_AGENT_BYTES: bytes
+    GMAIL_CONFIG: list[str]
     PROXY: str | None
+    MAX_CONN: int
+    MAX_KEEPALIVE: int
+    HTTP_BACKEND: str
+    RATE_LIMIT: float
+    MAX_RETRIES: int
+    XSRF_USE_HEAD: bool
 
     def set_proxy(self, proxy: str | None) -> None:
         """
@@ -71,32 +125,25 @@ class Config:
         """
         self.PROXY = proxy
 
-def load_config(
-        path: str | Path = Path(__file__).parent / "config.yaml"
-) -> Config:
-    """
-    Load configuration settings from a YAML file into a Config object.
 
-    Reads the YAML file at the given path and populates a Config instance
-    with values for API base URL, timeout, HTTP options, user agent, and
-    Gmail generation configuration. Default values are used if keys are
-    missing.
+_PACKAGED_CONFIG: Traversable = files("emailnator.config").joinpath("config.yaml")
+_DEFAULT_CONFIG_PATH: Path | None = (
+    _PACKAGED_CONFIG.resolve() if isinstance(_PACKAGED_CONFIG, Path) else None
+)
+_CONFIG_CACHE: dict[tuple[str, int, int], Config] = {}
+
+
+def _build_config(data: dict[str, Any]) -> Config:
+    """
+    Populate a Config instance from decoded YAML data.
 
     Args:
-        path (str | Path, optional): Path to the YAML configuration file.
-            Defaults to `config.yaml` in the same directory as this module.
+        data (dict[str, Any]): The decoded configuration file.
 
     Returns:
         Config: An instance of the Config class populated with settings
-            from the YAML file or default values.
+            from `data` or default values.
     """
-    try:
-        with open(path, "r", encoding="utf-8") as config_file:
-            data: dict[str, int | bool | str] = yaml.safe_load(config_file)
-    except FileNotFoundError:
-        logger.error(f"File {path}is not found")
-        raise
-
     config: Config = Config()
     config.BASE_URL = str(data.get("BASE_URL", "https://www.emailnator.com"))
     config.TIMEOUT = int(data.get("TIMEOUT", 15))
@@ -107,11 +154,88 @@ def load_config(
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
         )
     )
+    config.USER_AGENT_BYTES = config.USER_AGENT.encode("ascii")
     value = data.get("GMAIL_CONFIG", ["dotGmail", "plusGmail"])
     config.GMAIL_CONFIG = format_gmail_config(value)
     proxy = data.get("PROXY", None)
     config.PROXY = None if proxy is None else str(proxy)
+    config.MAX_CONN = int(data.get("MAX_CONN", 256))
+    config.MAX_KEEPALIVE = int(data.get("MAX_KEEPALIVE", 64))
+    config.HTTP_BACKEND = str(data.get("HTTP_BACKEND", "httpx"))
+    config.RATE_LIMIT = float(data.get("RATE_LIMIT", 0))
+    config.MAX_RETRIES = int(data.get("MAX_RETRIES", 3))
+    config.XSRF_USE_HEAD = bool(data.get("XSRF_USE_HEAD", False))
     return config
 
 
+def _load_packaged_config() -> Config:
+    """
+    Load the packaged `config.yaml` straight from its package resource.
+
+    Used when the package is imported from an archive (e.g. a zip file), where
+    the resource has no filesystem path to stat or mirror. The archive does
+    not change while the process runs, so the result is cached for its
+    lifetime.
+
+    Returns:
+        Config: The packaged default configuration.
+    """
+    key: tuple[str, int, int] = (str(_PACKAGED_CONFIG), 0, 0)
+    cached: Config | None = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = _build_config(
+            yaml_load(_PACKAGED_CONFIG.read_bytes(), Loader=_Loader)
+        )
+        _CONFIG_CACHE[key] = cached
+    return cached
+
+
+def load_config(path: str | Path | None = None) -> Config:
+    """
+    Load configuration settings from a YAML file into a Config object.
+
+    Reads the YAML file at the given path and populates a Config instance
+    with values for API base URL, timeout, HTTP options, user agent, and
+    Gmail generation configuration. Default values are used if keys are
+    missing. Loaded configs are cached by path, modification time and size,
+    so the file is parsed again only after it changes; call
+    `load_config.cache_clear()` to drop the cache.
+
+    Args:
+        path (str | Path | None, optional): Path to the YAML configuration
+            file. Defaults to the `config.yaml` resource of this package,
+            located through `importlib.resources`.
+
+    Returns:
+        Config: An instance of the Config class populated with settings
+            from the YAML file or default values.
+    """
+    if path is None:
+        if _DEFAULT_CONFIG_PATH is None:
+            return _load_packaged_config()
+        path = _DEFAULT_CONFIG_PATH
+
+    try:
+        stat: os.stat_result = os.stat(path)
+        key: tuple[str, int, int] = (
+            os.fspath(path),
+            stat.st_mtime_ns,
+            stat.st_size
+        )
+        cached: Config | None = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+        raw: bytes = Path(path).read_bytes()
+    except FileNotFoundError:
+        logger.error("File %s is not found", path)
+        raise
+
+    config: Config = _build_config(yaml_load(raw, Loader=_Loader))
+    _CONFIG_CACHE[key] = config
+    return config
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear
+
+
 config: Config = load_config()
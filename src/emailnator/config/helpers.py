@@ -22,7 +22,8 @@ Utility functions for Gmail configuration formatting.
 This module provides helper functions for normalizing and formatting
 configuration values related to Gmail integration. It ensures that
 values are consistently represented as lists of strings, which is
-useful for downstream processing in account generation.
+useful for downstream processing in account generation. Normalization is
+memoized internally on tuples; every call returns a new list.
 
 Typical usage example:
     from emailnator.config.helpers import format_gmail_config
@@ -33,24 +34,43 @@ Typical usage example:
     config = format_gmail_config(["a@gmail.com", "b@gmail.com"])
     print(config)  # ["a@gmail.com", "b@gmail.com"]
 """
-from typing import Any
+from functools import lru_cache
+from typing import Any, Hashable
 
 
-def format_gmail_config(value: Any) -> list:
+def format_gmail_config(value: Any) -> list[str]:
     """
     Format a value into a list of Gmail configuration strings.
 
+    Lists are converted to tuples first, so repeated lookups with equal
+    input hit the cache of `_format_gmail_config`. The returned list is a
+    new object, so callers may modify it freely.
+
     Args:
         value (Any): Input value that can either be a list of strings
             or a single value convertible to a string.
 
     Returns:
-        List[str]: A list containing the Gmail configuration strings.
+        list[str]: A list containing the Gmail configuration strings.
     """
     if isinstance(value, list):
-        gmail_config: list = value
-    else:
-        gmail_config: list = [str(value)]
+        value = tuple(value)
+    if not isinstance(value, Hashable):
+        return [str(value)]
+    return list(_format_gmail_config(value))
+
 
-    return gmail_config
+@lru_cache(maxsize=128)
+def _format_gmail_config(value: Hashable) -> tuple[str, ...]:
+    """
+    Memoized implementation of `format_gmail_config` for hashable input.
 
+    Args:
+        value (Hashable): A tuple of options or a single scalar value.
+
+    Returns:
+        tuple[str, ...]: A tuple containing the Gmail configuration strings.
+    """
+    if isinstance(value, tuple):
+        return value
+    return (str(value),)
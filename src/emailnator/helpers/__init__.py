@@ -17,8 +17,13 @@
 # <https://www.gnu.org/licenses/>.
 
 from emailnator.helpers.logger import logger
+from emailnator.helpers.serialization import json_dumps, json_loads
+from emailnator.helpers.validation import is_list_of
 
 
 __all__: tuple[str, ...] = (
     "logger",
+    "json_dumps",
+    "json_loads",
+    "is_list_of",
 )
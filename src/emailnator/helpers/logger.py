@@ -19,7 +19,11 @@
 """
 Configures and initializes the "email_generator" logger.
 
-The logger outputs logs to both the console and a rotating file.
+The logger outputs logs to both the console and a rotating file. Records
+are handed to a `QueueHandler`, and a `QueueListener` thread writes them to
+the handlers below, so logging calls never block the caller on console or
+disk I/O. The listener is stopped (and the queue flushed) at interpreter
+exit.
 
 Console handler:
     Level: INFO
@@ -39,10 +43,14 @@ Typical Usage Example:
 
 Attributes:
     logger (logging.Logger): Configured logger instance.
+    listener (QueueListener): Background listener that writes queued
+        records to the console and file handlers.
 """
+import atexit
 import logging
+import queue
 
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 logger: logging.Logger = logging.getLogger("email_generator")
@@ -56,7 +64,6 @@ console_formatter: logging.Formatter = logging.Formatter(
     "%(asctime)s | %(levelname)s | %(message)s"
 )
 console_handler.setFormatter(console_formatter)
-logger.addHandler(console_handler)
 
 file_handler: RotatingFileHandler = RotatingFileHandler(
     "email_generator.log",
@@ -69,5 +76,16 @@ file_formatter: logging.Formatter = logging.Formatter(
     "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 )
 file_handler.setFormatter(file_formatter)
-logger.addHandler(file_handler)
+
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+
+listener: QueueListener = QueueListener(
+    log_queue,
+    console_handler,
+    file_handler,
+    respect_handler_level=True
+)
+listener.start()
+atexit.register(listener.stop)
 
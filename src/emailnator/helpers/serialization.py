@@ -0,0 +1,78 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""
+JSON serialization helpers.
+
+Provides `json_loads`, which decodes JSON from ``bytes`` or ``str``, and
+`json_dumps`, which encodes an object to compact UTF-8 ``bytes`` ready to be
+sent as a request body. Both use ``orjson`` when the package is installed
+and fall back to the standard library ``json`` module otherwise. Decoding
+errors are subclasses of ``ValueError`` in both cases.
+
+Typical Usage Example:
+    from emailnator.helpers.serialization import json_dumps, json_loads
+
+    json_loads(b'{"email": ["a@gmail.com"]}')
+    {'email': ['a@gmail.com']}
+    json_dumps({"email": ["dotGmail"]})
+    b'{"email":["dotGmail"]}'
+"""
+from typing import Any
+
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    import json as _json
+
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """
+        Encode an object as compact JSON.
+
+        Args:
+            obj (Any): A JSON-serializable object.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        return _json.dumps(
+            obj,
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+else:
+    def json_dumps(obj: Any) -> bytes:
+        """
+        Encode an object as compact JSON.
+
+        Args:
+            obj (Any): A JSON-serializable object.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        return _orjson_dumps(obj)
+
+
+__all__: tuple[str, ...] = (
+    "json_dumps",
+    "json_loads",
+)
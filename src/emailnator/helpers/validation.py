@@ -0,0 +1,58 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""
+Lightweight validation helpers for API responses.
+
+Provides `is_list_of`, which checks that a decoded JSON value is a list of
+items of one type. The full per-item scan only runs in debug mode; under
+``python -O`` the first item is sampled instead.
+
+Typical Usage Example:
+    from emailnator.helpers.validation import is_list_of
+
+    is_list_of(["a@gmail.com"], str)
+    True
+    is_list_of("a@gmail.com", str)
+    False
+"""
+from typing import Any
+
+
+def is_list_of(value: Any, kind: type) -> bool:
+    """
+    Check that `value` is a list whose items are instances of `kind`.
+
+    Every item is checked in debug mode; under ``python -O`` only the first
+    item is sampled, trusting the API to return homogeneous lists. The full
+    check collects the distinct item types with ``set(map(type, value))``,
+    which runs in C, and then tests only those few types against `kind`.
+
+    Args:
+        value (Any): The value to check.
+        kind (type): Expected type of the list items.
+
+    Returns:
+        bool: True if `value` passes the check, otherwise False.
+    """
+    if not isinstance(value, list):
+        return False
+    if __debug__:
+        item_types: set[type] = set(map(type, value))
+        return all(issubclass(item_type, kind) for item_type in item_types)
+    return not value or isinstance(value[0], kind)
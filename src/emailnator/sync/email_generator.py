@@ -33,13 +33,121 @@ Typical Usage example:
     print(messages)
     bulk = gen.generate_bulk_emails("200")
     print(bulk)
+    many = gen.generate_many(10)
+    print(many)
+    gen.close()
 """
 import asyncio
+import atexit
 import re
+import threading
 
-from typing import Literal
+from typing import Any, Coroutine, Literal, TypeVar
 
+from emailnator.asyncio.builders.builders import AsyncEmailnatorClient
 from emailnator.asyncio.email_generator import AsyncEmailGenerator
+from emailnator.helpers import logger
+
+
+T = TypeVar("T")
+
+_GLOBAL_LOCK: threading.Lock = threading.Lock()
+_GLOBAL_LOOP: asyncio.AbstractEventLoop | None = None
+_GLOBAL_THREAD: threading.Thread | None = None
+_GLOBAL_USERS: int = 0
+_ALLOWED_BULK: frozenset[str] = frozenset(("100", "200", "300"))
+_EMAIL_RE: re.Pattern[str] = re.compile(r"[^@\s]+@[^@\s]+\.[A-Za-z0-9]+")
+_EXPECTED: frozenset[str] = frozenset(("messageID", "from", "subject", "time"))
+
+
+def _acquire_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background event loop, starting it on first use.
+
+    Every call must be paired with `_release_loop()`.
+
+    Returns:
+        asyncio.AbstractEventLoop: The loop running in the shared daemon thread.
+    """
+    global _GLOBAL_LOOP, _GLOBAL_THREAD, _GLOBAL_USERS
+    with _GLOBAL_LOCK:
+        if _GLOBAL_LOOP is None:
+            _GLOBAL_LOOP = asyncio.new_event_loop()
+            _GLOBAL_THREAD = threading.Thread(
+                target=_GLOBAL_LOOP.run_forever,
+                name="emailnator-event-loop",
+                daemon=True
+            )
+            _GLOBAL_THREAD.start()
+        _GLOBAL_USERS += 1
+        return _GLOBAL_LOOP
+
+
+def _release_loop() -> None:
+    """
+    Drop one user of the shared event loop.
+
+    When the last user is released, the shared HTTP client is closed, the
+    loop is stopped and its thread is joined. A later `_acquire_loop()`
+    starts a new loop.
+    """
+    global _GLOBAL_LOOP, _GLOBAL_THREAD, _GLOBAL_USERS
+    with _GLOBAL_LOCK:
+        _GLOBAL_USERS = max(_GLOBAL_USERS - 1, 0)
+        if _GLOBAL_USERS > 0 or _GLOBAL_LOOP is None or _GLOBAL_THREAD is None:
+            return
+        loop, thread = _GLOBAL_LOOP, _GLOBAL_THREAD
+        _GLOBAL_LOOP = _GLOBAL_THREAD = None
+
+    _stop_loop(loop, thread)
+
+
+def _stop_loop(
+    loop: asyncio.AbstractEventLoop,
+    thread: threading.Thread,
+    timeout: float | None = None,
+) -> None:
+    """
+    Close the shared HTTP client, then stop and close the loop.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The loop to stop.
+        thread (threading.Thread): The thread running `loop`.
+        timeout (float | None, optional): Seconds to wait for the client to
+            close and the thread to finish. Defaults to None (no limit).
+    """
+    try:
+        asyncio.run_coroutine_threadsafe(
+            AsyncEmailnatorClient.aclose(),
+            loop
+        ).result(timeout)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+@atexit.register
+def _shutdown_loop() -> None:
+    """
+    Stop the shared event loop at interpreter exit.
+
+    Covers `EmailGenerator` instances that were never closed, so the
+    HTTP client is closed cleanly instead of being dropped with the
+    daemon thread.
+    """
+    global _GLOBAL_LOOP, _GLOBAL_THREAD, _GLOBAL_USERS
+    with _GLOBAL_LOCK:
+        loop, thread = _GLOBAL_LOOP, _GLOBAL_THREAD
+        _GLOBAL_LOOP = _GLOBAL_THREAD = None
+        _GLOBAL_USERS = 0
+    if loop is None or thread is None:
+        return
+    try:
+        _stop_loop(loop, thread, timeout=5.0)
+    except Exception as exc:
+        logger.warning("Failed to close the shared HTTP client: %r", exc)
 
 
 class EmailGenerator:
@@ -51,10 +159,15 @@ class EmailGenerator:
     `AsyncEmailGenerator`, making it convenient to use in codebases
     that are not async-aware.
 
+    All instances share one event loop running in a background daemon
+    thread, so they also share one HTTP connection pool and XSRF token.
+
     Attributes:
         _loop (asyncio.AbstractEventLoop):
-            Event loop used to execute asynchronous operations
-            in a synchronous context.
+            Shared event loop running in a background thread, used to
+            execute asynchronous operations in a synchronous context.
+        _closed (bool):
+            Whether `close()` has already been called.
         _async (AsyncEmailGenerator):
             Internal asynchronous generator instance responsible for
             performing the actual operations.
@@ -66,15 +179,80 @@ class EmailGenerator:
         This sets up an internal instance of `AsyncEmailGenerator`
         to handle the underlying asynchronous operations, which are
         then exposed through synchronous wrappers.
+
+        The shared event loop is started on first use and kept running,
+        so the HTTP connection pool and XSRF state stay warm between calls.
+        """
+        self._loop: asyncio.AbstractEventLoop = _acquire_loop()
+        self._closed: bool = False
+        try:
+            self._async: AsyncEmailGenerator = self._run(AsyncEmailGenerator())
+        except BaseException:
+            self.close()
+            raise
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the background event loop and wait for its result.
+
+        Args:
+            coro (Coroutine[Any, Any, T]): The coroutine to execute.
+
+        Returns:
+            T: The value returned by the coroutine.
+
+        Raises:
+            RuntimeError: If called from the background loop's own thread,
+                where waiting for the result would deadlock.
         """
         try:
-            self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
         except RuntimeError:
-            self._loop: asyncio.AbstractEventLoop= asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-        self._async: AsyncEmailGenerator = self._loop.run_until_complete(
-            AsyncEmailGenerator()
-        )
+            running = None
+        if running is self._loop:
+            coro.close()
+            raise RuntimeError(
+                "EmailGenerator methods cannot be called from its own event "
+                "loop thread; await the AsyncEmailGenerator methods instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """
+        Release this generator's hold on the shared event loop.
+
+        When the last open generator is closed, the shared HTTP client is
+        closed and the background loop is stopped. The generator cannot be
+        used after it has been closed; calling `close()` again has no effect.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _release_loop()
+
+    @staticmethod
+    def _check_generated_email(email: Any) -> str:
+        """
+        Validate an email address returned by the async generator.
+
+        Args:
+            email (Any): The value returned by the async generator.
+
+        Returns:
+            str: The validated email address.
+
+        Raises:
+            RuntimeError: If the value is not a plausible email address.
+        """
+        if not isinstance(email, str) or not email.strip():
+            raise RuntimeError(
+                "Email generator returned invalid or empty data."
+            )
+
+        if "@" not in email or "." not in email.split("@")[-1]:
+            raise RuntimeError(f"Invalid email format returned: {email!r}")
+
+        return email
 
     def generate_email(self) -> str:
         """
@@ -90,17 +268,36 @@ class EmailGenerator:
             RuntimeError: If the underlying async generator fails to return
             a valid email address.
         """
-        email = self._loop.run_until_complete(self._async.generate_email())
+        email = self._run(self._async.generate_email())
+        return self._check_generated_email(email)
 
-        if not isinstance(email, str) or not email.strip():
-            raise RuntimeError(
-                "Email generator returned invalid or empty data."
-            )
+    def generate_many(self, n: int) -> list[str]:
+        """
+        Generate several email addresses concurrently.
 
-        if "@" not in email or "." not in email.split("@")[-1]:
-            raise RuntimeError(f"Invalid email format returned: {email!r}")
+        All `n` requests run at once on the shared event loop instead of
+        one blocking call after another.
 
-        return email
+        Args:
+            n (int): Number of email addresses to generate.
+
+        Returns:
+            list[str]: The newly generated email addresses.
+
+        Raises:
+            ValueError: If `n` is less than 1.
+            RuntimeError: If any generated address is invalid.
+        """
+        if n < 1:
+            raise ValueError("n must be a positive integer.")
+
+        async def generate_all() -> list[str]:
+            return await asyncio.gather(
+                *(self._async.generate_email() for _ in range(n))
+            )
+
+        emails: list[str] = self._run(generate_all())
+        return [self._check_generated_email(email) for email in emails]
 
     def get_messages(self, email: str) -> list[dict[str, str]]:
         """
@@ -124,10 +321,10 @@ class EmailGenerator:
         if not isinstance(email, str) or not email.strip():
             raise ValueError("Email must be a non-empty string.")
 
-        if not re.match(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+$", email):
+        if not _EMAIL_RE.fullmatch(email):
             raise ValueError(f"Invalid email format: {email}")
 
-        messages: list[dict[str, str]] = self._loop.run_until_complete(
+        messages: list[dict[str, str]] = self._run(
             self._async.get_messages(
                 email
             )
@@ -138,17 +335,18 @@ class EmailGenerator:
                 "Message getter returned invalid data type (expected list)."
             )
 
-        if not all(isinstance(m, dict) for m in messages):
+        try:
+            valid: bool = all(m.keys() >= _EXPECTED for m in messages)
+        except AttributeError:
             raise RuntimeError(
                 "Message getter returned a list with non-dict elements."
-            )
+            ) from None
 
-        expected_keys: set = {"messageID", "from", "subject", "time"}
-        for msg in messages:
-            if not expected_keys.issubset(msg.keys()):
-                raise RuntimeError(
-                    f"Message object missing required fields: {msg}"
-                )
+        if not valid:
+            msg = next(m for m in messages if not m.keys() >= _EXPECTED)
+            raise RuntimeError(
+                f"Message object missing required fields: {msg}"
+            )
 
         return messages
 
@@ -181,7 +379,7 @@ class EmailGenerator:
         ) or not re.match(email_regex, email):
             raise ValueError("Email must be a valid email address.")
 
-        message = self._loop.run_until_complete(
+        message = self._run(
             self._async.get_message_from_sender(
                 sender,
                 email
@@ -219,7 +417,7 @@ class EmailGenerator:
         if not sender or not isinstance(sender, str):
             raise ValueError("Sender must be a non-empty string.")
 
-        message = self._loop.run_until_complete(
+        message = self._run(
             self._async.parse_message_from_sender(
                 messages,
                 sender,
@@ -249,13 +447,13 @@ class EmailGenerator:
         if not isinstance(email, str) or not email.strip():
             raise ValueError("Email must be a non-empty string.")
 
-        if not re.match(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+$", email):
+        if not _EMAIL_RE.fullmatch(email):
             raise ValueError(f"Invalid email format: {email}")
 
         if not isinstance(message_id, str) or not message_id.strip():
             raise ValueError("Message ID must be a non-empty string.")
 
-        message_content: str = self._loop.run_until_complete(
+        message_content: str = self._run(
             self._async.get_message(email, message_id)
         )
 
@@ -292,12 +490,12 @@ class EmailGenerator:
             ValueError: If `emails_number` is invalid.
             RuntimeError: If the async generator returns invalid or empty data.
         """
-        if emails_number not in {"100", "200", "300"}:
+        if emails_number not in _ALLOWED_BULK:
             raise ValueError(
                 f"Invalid emails_number '{emails_number}'. Must be one of '100', '200', or '300'."
             )
 
-        emails: list = self._loop.run_until_complete(
+        emails: list = self._run(
             self._async.generate_bulk_emails(emails_number)
         )
 
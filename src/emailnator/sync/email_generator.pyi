@@ -5,11 +5,14 @@ from emailnator.asyncio.email_generator import AsyncEmailGenerator
 class EmailGenerator:
     _async: AsyncEmailGenerator
     _loop: object
+    _closed: bool
 
     def __init__(self) -> None: ...
+    def close(self) -> None: ...
     @property
     def async_client(self) -> AsyncEmailGenerator: ...
     def generate_email(self) -> str: ...
+    def generate_many(self, n: int) -> list[str]: ...
     def get_messages(self, email: str) -> list[str]: ...
     def get_message(self, email, message_id) -> str: ...
     def generate_bulk_emails(self, emails_number: Literal["100", "200", "300"] = "100") -> list[str]: ...
@@ -0,0 +1,85 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import copy
+
+import pytest
+import pytest_asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+
+from emailnator.asyncio import generators as generators_module
+from emailnator.asyncio import message_getter as message_getter_module
+from emailnator.asyncio.builders.builders import AsyncEmailnatorClient
+from emailnator.asyncio.email_generator import AsyncEmailGenerator
+from emailnator.asyncio.generators import Generators
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_async_gen():
+    """Construct one AsyncEmailGenerator for the whole test session."""
+    gen = await AsyncEmailGenerator()
+    yield gen
+    await AsyncEmailnatorClient.aclose()
+
+
+@pytest.fixture
+def async_gen(shared_async_gen):
+    """
+    Return a per-test copy of the shared generator with fresh mocks.
+
+    The shallow copy keeps attributes a test rebinds (including methods
+    replaced with mocks) from leaking into other tests.
+    """
+    gen = copy.copy(shared_async_gen)
+    gen._generators = AsyncMock()
+    gen._message_getter = AsyncMock()
+    gen._index_cache = OrderedDict()
+    return gen
+
+
+@pytest.fixture
+def emailnator_client(monkeypatch):
+    """
+    Replace the Emailnator client of Generators and MessageGetter with a mock.
+
+    The mock hands out an AsyncMock backend and client and empty headers,
+    so the real `__ainit__` methods run offline.
+    """
+    client = AsyncMock()
+    client.get_client.return_value = AsyncMock()
+    client.get_backend.return_value = AsyncMock()
+    client.get_headers.return_value = {}
+    client.get_headers_view.return_value = {}
+    for module in (generators_module, message_getter_module):
+        monkeypatch.setattr(
+            module,
+            "AsyncEmailnatorClient",
+            AsyncMock(return_value=client)
+        )
+    return client
+
+
+@pytest_asyncio.fixture
+async def generators(emailnator_client):
+    """
+    Build a Generators instance offline through its real `__ainit__`.
+
+    Tests only configure `generators.backend.post`.
+    """
+    return await Generators()
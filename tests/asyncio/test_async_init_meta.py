@@ -0,0 +1,45 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import pytest
+from emailnator.asyncio.helpers.metaclass import AsyncInitMeta
+
+
+class WithArgs(metaclass=AsyncInitMeta):
+    async def __ainit__(self, value: int, *, label: str = "") -> None:
+        self.value = value
+        self.label = label
+
+
+class WithoutAinit(metaclass=AsyncInitMeta):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_args_are_forwarded_only_to_ainit():
+    obj = await WithArgs(42, label="answer")
+    assert obj.value == 42
+    assert obj.label == "answer"
+
+
+@pytest.mark.asyncio
+async def test_class_without_ainit_is_constructed():
+    obj = await WithoutAinit()
+    assert isinstance(obj, WithoutAinit)
+    assert WithoutAinit._has_ainit is False
+    assert WithArgs._has_ainit is True
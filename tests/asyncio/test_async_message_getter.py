@@ -0,0 +1,242 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from emailnator.asyncio.message_getter import MessageGetter
+from emailnator.config.config import config
+
+
+pytestmark = pytest.mark.usefixtures("emailnator_client")
+
+MESSAGES = [{"messageID": "1", "from": "Bob", "subject": "Hi", "time": "Now"}]
+
+
+async def make_getter() -> MessageGetter:
+    getter = await MessageGetter()
+    getter.active = getter.peak = 0
+
+    async def post(*args, **kwargs):
+        getter.active += 1
+        getter.peak = max(getter.peak, getter.active)
+        await asyncio.sleep(0)
+        getter.active -= 1
+        return httpx.Response(200, json={"messageData": MESSAGES})
+
+    getter.client = AsyncMock()
+    getter.client.post.side_effect = post
+    return getter
+
+
+@pytest.mark.asyncio
+class TestMessageGetterMessageList:
+
+    async def test_concurrent_calls_share_one_request(self):
+        """Should send one request for concurrent polls of the same email."""
+        getter = await make_getter()
+
+        results = await asyncio.gather(
+            *(getter.get_message_list("test@gmail.com") for _ in range(5))
+        )
+
+        assert all(result == MESSAGES for result in results)
+        getter.client.post.assert_awaited_once()
+        assert not getter._inflight
+
+    async def test_different_emails_are_fetched_separately(self):
+        """Should not merge requests for different emails."""
+        getter = await make_getter()
+
+        await asyncio.gather(
+            getter.get_message_list("a@gmail.com"),
+            getter.get_message_list("b@gmail.com"),
+        )
+
+        assert getter.client.post.await_count == 2
+
+    async def test_sequential_calls_refetch(self):
+        """Should send a new request once the previous one finished."""
+        getter = await make_getter()
+
+        await getter.get_message_list("test@gmail.com")
+        await getter.get_message_list("test@gmail.com")
+
+        assert getter.client.post.await_count == 2
+
+    async def test_request_body_is_pre_encoded_json(self):
+        """Should send the email as an already encoded JSON body."""
+        getter = await make_getter()
+
+        await getter.get_message_list("test@gmail.com")
+
+        kwargs = getter.client.post.await_args.kwargs
+        assert kwargs["content"] == b'{"email":"test@gmail.com"}'
+        assert "json" not in kwargs
+
+    async def test_ttl_reuses_recent_list(self):
+        """Should answer repeated polls from the cache within the TTL."""
+        getter = await make_getter()
+
+        first = await getter.get_message_list("test@gmail.com", ttl=60)
+        second = await getter.get_message_list("test@gmail.com", ttl=60)
+
+        assert first == second == MESSAGES
+        assert first is not second
+        getter.client.post.assert_awaited_once()
+
+    async def test_concurrent_requests_are_bounded(self):
+        """Should not send more than max_concurrent_requests at once."""
+        getter = await make_getter()
+        getter._semaphore = asyncio.Semaphore(2)
+
+        await asyncio.gather(
+            *(getter.get_message_list(f"{i}@gmail.com") for i in range(6))
+        )
+
+        assert getter.client.post.await_count == 6
+        assert getter.peak == 2
+
+
+async def make_streaming_getter(
+    body: bytes,
+    status: int = 200,
+    headers: dict[str, str] | None = None,
+) -> MessageGetter:
+    getter = await MessageGetter()
+    getter.requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        getter.requests.append(request)
+        return httpx.Response(status, content=body, headers=headers)
+
+    getter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return getter
+
+
+@pytest.mark.asyncio
+class TestMessageGetterMessage:
+
+    async def test_get_message_decodes_streamed_body(self):
+        """Should return the streamed body decoded as UTF-8."""
+        getter = await make_streaming_getter("<p>Привет</p>".encode())
+
+        result = await getter.get_message("test@gmail.com", "1")
+
+        assert result == "<p>Привет</p>"
+        await getter.client.aclose()
+
+    async def test_get_message_uses_declared_charset(self):
+        """Should decode the body with the charset from Content-Type."""
+        getter = await make_streaming_getter(
+            "<p>Привет</p>".encode("cp1251"),
+            headers={"Content-Type": "text/html; charset=windows-1251"}
+        )
+
+        result = await getter.get_message("test@gmail.com", "1")
+
+        assert result == "<p>Привет</p>"
+        await getter.client.aclose()
+
+    async def test_get_message_bytes_returns_raw_body(self):
+        """Should return the body without decoding it."""
+        getter = await make_streaming_getter(b"<p>\xff</p>")
+
+        result = await getter.get_message_bytes("test@gmail.com", "1")
+
+        assert result == b"<p>\xff</p>"
+        await getter.client.aclose()
+
+    async def test_repeated_message_is_served_from_cache(self):
+        """Should fetch a message body only once."""
+        getter = await make_streaming_getter(b"<p>Hi</p>")
+
+        await getter.get_message("test@gmail.com", "1")
+        result = await getter.get_message("test@gmail.com", "1")
+
+        assert result == "<p>Hi</p>"
+        assert len(getter.requests) == 1
+        await getter.client.aclose()
+
+    async def test_message_cache_evicts_least_recently_used(self):
+        """Should drop the oldest body once the cache is full."""
+        getter = await make_streaming_getter(b"<p>Hi</p>")
+        getter.message_cache_size = 2
+
+        for message_id in ("1", "2", "1", "3"):
+            await getter.get_message_bytes("test@gmail.com", message_id)
+
+        assert list(getter._message_cache) == [
+            ("test@gmail.com", "1", config.BASE_URL),
+            ("test@gmail.com", "3", config.BASE_URL),
+        ]
+        await getter.client.aclose()
+
+    async def test_error_responses_are_not_cached(self):
+        """Should not keep bodies of failed requests."""
+        getter = await make_streaming_getter(b"error", status=500)
+
+        await getter.get_message("test@gmail.com", "1")
+        await getter.get_message("test@gmail.com", "1")
+
+        assert len(getter.requests) == 2
+        await getter.client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ainit_encodes_headers_once(monkeypatch):
+    """Should store the default headers as an httpx.Headers instance."""
+    emailnator_client = AsyncMock()
+    emailnator_client.get_headers_view.return_value = {"X-XSRF-TOKEN": "token"}
+
+    async def fake_client():
+        return emailnator_client
+
+    monkeypatch.setattr(
+        "emailnator.asyncio.message_getter.AsyncEmailnatorClient", fake_client
+    )
+
+    getter = await MessageGetter()
+
+    assert isinstance(getter.headers, httpx.Headers)
+    assert getter.headers["x-xsrf-token"] == "token"
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_the_host_limiter(monkeypatch):
+    """Should pass both message endpoints through the shared rate limiter."""
+    limiter = AsyncMock()
+    urls = []
+
+    def get_limiter(url, rate):
+        urls.append(url)
+        return limiter
+
+    monkeypatch.setattr(
+        "emailnator.asyncio.message_getter.get_host_limiter", get_limiter
+    )
+    getter = await make_streaming_getter(b'{"messageData": []}')
+
+    await getter.get_message_list("test@gmail.com")
+    await getter.get_message_bytes("test@gmail.com", "1")
+
+    assert limiter.acquire.await_count == 2
+    assert urls == [config.BASE_URL + "/message-list"] * 2
+    await getter.client.aclose()
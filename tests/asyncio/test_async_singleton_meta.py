@@ -0,0 +1,100 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+from emailnator.asyncio.builders.helpers.metaclass import AsyncSingletonMeta
+
+
+class Counter(metaclass=AsyncSingletonMeta):
+    created = 0
+
+    async def __ainit__(self) -> None:
+        Counter.created += 1
+
+
+@pytest.mark.asyncio
+async def test_same_loop_returns_same_instance():
+    first = await Counter()
+    second = await Counter()
+    assert first is second
+
+
+def test_each_loop_gets_its_own_instance():
+    first = asyncio.run(Counter())
+    second = asyncio.run(Counter())
+    assert first is not second
+
+
+class FailsOnce(metaclass=AsyncSingletonMeta):
+    attempts = 0
+
+    async def __ainit__(self) -> None:
+        FailsOnce.attempts += 1
+        if FailsOnce.attempts == 1:
+            raise RuntimeError("init failed")
+
+
+@pytest.mark.asyncio
+async def test_failed_init_is_not_cached():
+    with pytest.raises(RuntimeError, match="init failed"):
+        await FailsOnce()
+
+    instance = await FailsOnce()
+    assert FailsOnce.attempts == 2
+    assert instance is await FailsOnce()
+
+
+class InheritsAinit(Counter):
+    pass
+
+
+def test_ainit_presence_is_resolved_per_class():
+    assert Counter._has_ainit
+    assert InheritsAinit._has_ainit
+
+
+class SlowInit(metaclass=AsyncSingletonMeta):
+    created = 0
+
+    async def __ainit__(self) -> None:
+        SlowInit.created += 1
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_initialization():
+    instances = await asyncio.gather(*(SlowInit() for _ in range(5)))
+    assert SlowInit.created == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
+class SlowFailure(metaclass=AsyncSingletonMeta):
+    async def __ainit__(self) -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("init failed")
+
+
+@pytest.mark.asyncio
+async def test_failed_init_is_raised_to_every_waiter():
+    results = await asyncio.gather(
+        *(SlowFailure() for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not SlowFailure._pending
@@ -0,0 +1,92 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import httpx
+import pytest
+from emailnator.asyncio.builders.backends import (
+    AiohttpBackend,
+    HttpxBackend,
+    create_backend,
+)
+from emailnator.config.config import config
+
+
+def test_create_backend_httpx():
+    client = httpx.AsyncClient()
+    assert isinstance(create_backend("httpx", client), HttpxBackend)
+
+
+def test_create_backend_unknown_raises_valueerror():
+    with pytest.raises(ValueError, match="Unknown HTTP_BACKEND"):
+        create_backend("curl", httpx.AsyncClient())
+
+
+@pytest.mark.asyncio
+async def test_httpx_backend_posts_content():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["X-Test"] == "1"
+        assert request.content == b'{"email":["dotGmail"]}'
+        return httpx.Response(200, json={"email": ["a@gmail.com"]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    backend = HttpxBackend(client)
+
+    response = await backend.post(
+        "https://example.com/generate-email",
+        headers={"X-Test": "1"},
+        content=b'{"email":["dotGmail"]}',
+    )
+
+    assert response.json() == {"email": ["a@gmail.com"]}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_posts_content_and_shares_cookies():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def handler(request):
+        assert request.headers["X-Test"] == "1"
+        assert request.cookies["XSRF-TOKEN"] == "abc"
+        assert request.headers["User-Agent"] == config.USER_AGENT
+        assert await request.read() == b'{"email":["dotGmail"]}'
+        response = web.json_response({"email": ["a@gmail.com"]})
+        response.set_cookie("session", "s1")
+        return response
+
+    app = web.Application()
+    app.router.add_post("/generate-email", handler)
+    client = httpx.AsyncClient()
+    client.cookies.set("XSRF-TOKEN", "abc")
+    backend = create_backend("aiohttp", client)
+
+    async with TestServer(app) as server:
+        response = await backend.post(
+            str(server.make_url("/generate-email")),
+            headers={"X-Test": "1"},
+            content=b'{"email":["dotGmail"]}',
+        )
+    await backend.aclose()
+    await client.aclose()
+
+    assert isinstance(backend, AiohttpBackend)
+    assert response.status_code == 200
+    assert response.json() == {"email": ["a@gmail.com"]}
+    assert client.cookies.get("session") == "s1"
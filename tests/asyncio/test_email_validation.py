@@ -0,0 +1,59 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import re
+
+import pytest
+from emailnator.asyncio.email_generator import AsyncEmailGenerator, _is_valid_email
+
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+$")
+
+
+@pytest.mark.parametrize("email", [
+    "test@gmail.com",
+    "first.last+tag@mail.example.co",
+    "a@b.c1",
+    "",
+    "@gmail.com",
+    "test@.com",
+    "test@gmail.",
+    "test@gmail",
+    "te st@gmail.com",
+    "test@gm\tail.com",
+    "test@@gmail.com",
+    "test@gmail@x.com",
+    "test@gmail.c-m",
+    "test@gmail.cöm",
+    "test@sub..com",
+])
+def test_matches_email_pattern(email):
+    assert _is_valid_email(email) == bool(EMAIL_PATTERN.match(email))
+
+
+def test_validated_email_is_not_checked_again(monkeypatch):
+    email = AsyncEmailGenerator._validate_email("test@gmail.com")
+    assert email == "test@gmail.com"
+
+    monkeypatch.setattr(
+        "emailnator.asyncio.email_generator._is_valid_email",
+        lambda email: False
+    )
+    assert AsyncEmailGenerator._validate_email(email) is email
+    with pytest.raises(ValueError):
+        AsyncEmailGenerator._validate_email("test@gmail.com")
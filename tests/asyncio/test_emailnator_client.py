@@ -0,0 +1,123 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from emailnator.asyncio.builders.builders import AsyncEmailnatorClient
+from emailnator.asyncio.builders.helpers.xsrf_token_service import XsrfManager
+from emailnator.asyncio.generators import Generators
+from emailnator.asyncio.message_getter import MessageGetter
+from emailnator.config.config import config
+
+
+@pytest.mark.asyncio
+class TestAsyncEmailnatorClientAclose:
+
+    async def test_closes_instance_of_running_loop(self):
+        """Should close the client registered for the running loop."""
+        instance = AsyncEmailnatorClient.__new__(AsyncEmailnatorClient)
+        instance.close = AsyncMock()
+        loop = asyncio.get_running_loop()
+        AsyncEmailnatorClient._instances[loop] = instance
+        try:
+            await AsyncEmailnatorClient.aclose()
+        finally:
+            AsyncEmailnatorClient._instances.pop(loop, None)
+
+        instance.close.assert_awaited_once()
+
+    async def test_without_instance_does_nothing(self):
+        """Should not fail when no client exists on the loop."""
+        await AsyncEmailnatorClient.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_carry_configured_user_agent():
+    """Should send the pre-encoded client default User-Agent on API requests."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200)
+
+    client = await AsyncEmailnatorClient()
+    try:
+        http_client = await client.get_client()
+        http_client._transport = httpx.MockTransport(handler)
+        backend = await client.get_backend()
+        headers = {**dict(XsrfManager._STATIC_HEADERS), "X-XSRF-TOKEN": "t"}
+
+        await backend.post(config.BASE_URL, headers=headers, content=b"{}")
+    finally:
+        await AsyncEmailnatorClient.aclose()
+
+    assert "User-Agent" not in headers
+    assert sent[0].headers["User-Agent"] == config.USER_AGENT
+    assert config.USER_AGENT_BYTES == config.USER_AGENT.encode("ascii")
+
+@pytest.mark.asyncio
+async def test_construction_is_offline_and_starts_no_task():
+    """Should not fetch a token or leave a background task behind."""
+    before = asyncio.all_tasks()
+    client = await AsyncEmailnatorClient()
+    try:
+        assert asyncio.all_tasks() == before
+        assert client._xsrf._token is None
+    finally:
+        await AsyncEmailnatorClient.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_pick_up_a_refreshed_xsrf_token():
+    """Should send the new X-XSRF-TOKEN once the old token is refreshed."""
+    tokens = iter(["first", "second"])
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method in ("HEAD", "GET"):
+            return httpx.Response(
+                200, headers={"Set-Cookie": f"XSRF-TOKEN={next(tokens)}"}
+            )
+        sent.append((request.url.path, request.headers["X-XSRF-TOKEN"]))
+        if request.url.path == "/generate-email":
+            return httpx.Response(200, json={"email": ["a@gmail.com"]})
+        return httpx.Response(200, json={"messageData": []})
+
+    client = await AsyncEmailnatorClient()
+    try:
+        (await client.get_client())._transport = httpx.MockTransport(handler)
+        generators = await Generators()
+        getter = await MessageGetter()
+
+        await generators.generate_email()
+        await getter.get_message_list("a@gmail.com")
+        client._xsrf._fetched_at -= client._xsrf.token_max_age
+        await generators.generate_email()
+        await getter.get_message_list("a@gmail.com")
+    finally:
+        await AsyncEmailnatorClient.aclose()
+
+    assert sent == [
+        ("/generate-email", "first"),
+        ("/message-list", "first"),
+        ("/generate-email", "second"),
+        ("/message-list", "second"),
+    ]
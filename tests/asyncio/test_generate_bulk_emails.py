@@ -17,67 +17,54 @@
 # <https://www.gnu.org/licenses/>.
 
 import pytest
-from unittest.mock import AsyncMock
-from emailnator.asyncio.email_generator import AsyncEmailGenerator
 
 
-@pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio
+
+
 class TestAsyncEmailGeneratorGenerateBulkEmails:
 
-    async def test_valid_call_returns_list_of_emails(self):
+    async def test_valid_call_returns_list_of_emails(self, async_gen):
         """Should return a list of valid email strings for valid emails_number."""
-        mock_generators = AsyncMock()
-        mock_generators.generate_bulk_emails.return_value = [
+        gen = async_gen
+        gen._generators.generate_bulk_emails.return_value = [
             "user1@example.com", "user2@example.com"
         ]
 
-        gen = await AsyncEmailGenerator()
-        gen._generators = mock_generators
-
         result = await gen.generate_bulk_emails("200")
 
         assert isinstance(result, list)
         assert all(isinstance(email, str) for email in result)
         assert len(result) == 2
-        mock_generators.generate_bulk_emails.assert_awaited_once_with("200")
+        gen._generators.generate_bulk_emails.assert_awaited_once_with("200")
 
-    async def test_invalid_emails_number_raises_valueerror(self):
+    async def test_invalid_emails_number_raises_valueerror(self, async_gen):
         """Should raise ValueError when emails_number is not one of allowed values."""
-        gen = await AsyncEmailGenerator()
-        gen._generators = AsyncMock()
+        gen = async_gen
 
         with pytest.raises(ValueError, match="Invalid emails_number"):
             await gen.generate_bulk_emails("999")
 
-    async def test_generator_returns_non_list_raises_runtimeerror(self):
+    async def test_generator_returns_non_list_raises_runtimeerror(self, async_gen):
         """Should raise RuntimeError if generator returns non-list data."""
-        mock_generators = AsyncMock()
-        mock_generators.generate_bulk_emails.return_value = "not-a-list"
-
-        gen = await AsyncEmailGenerator()
-        gen._generators = mock_generators
+        gen = async_gen
+        gen._generators.generate_bulk_emails.return_value = "not-a-list"
 
         with pytest.raises(RuntimeError, match="invalid data type"):
             await gen.generate_bulk_emails("100")
 
-    async def test_generator_returns_empty_list_raises_runtimeerror(self):
+    async def test_generator_returns_empty_list_raises_runtimeerror(self, async_gen):
         """Should raise RuntimeError if generator returns empty list."""
-        mock_generators = AsyncMock()
-        mock_generators.generate_bulk_emails.return_value = []
-
-        gen = await AsyncEmailGenerator()
-        gen._generators = mock_generators
+        gen = async_gen
+        gen._generators.generate_bulk_emails.return_value = []
 
         with pytest.raises(RuntimeError, match="empty list"):
             await gen.generate_bulk_emails("300")
 
-    async def test_generator_returns_list_with_invalid_items_raises_runtimeerror(self):
+    async def test_generator_returns_list_with_invalid_items_raises_runtimeerror(self, async_gen):
         """Should raise RuntimeError if list contains non-string elements."""
-        mock_generators = AsyncMock()
-        mock_generators.generate_bulk_emails.return_value = ["ok@example.com", 123]
-
-        gen = await AsyncEmailGenerator()
-        gen._generators = mock_generators
+        gen = async_gen
+        gen._generators.generate_bulk_emails.return_value = ["ok@example.com", 123]
 
         with pytest.raises(RuntimeError, match="invalid data type"):
             await gen.generate_bulk_emails("100")
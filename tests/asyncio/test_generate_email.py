@@ -17,40 +17,38 @@
 # <https://www.gnu.org/licenses/>.
 
 import pytest
-from unittest.mock import AsyncMock
-
-from emailnator.asyncio.email_generator import AsyncEmailGenerator
 
 
 @pytest.mark.asyncio
-async def test_generate_email_success():
-    gen = await AsyncEmailGenerator()
-    gen._generators.generate_email = AsyncMock(return_value=["test@example.com", "x@example.com"])
+async def test_generate_email_success(async_gen):
+    gen = async_gen
+    gen._generators.generate_email.return_value = ["test@example.com", "x@example.com"]
 
     result = await gen.generate_email()
 
     assert result == "test@example.com"
+    assert type(result) is str
     gen._generators.generate_email.assert_awaited_once()
 
 @pytest.mark.asyncio
-async def test_generate_email_empty_list():
-    gen = await AsyncEmailGenerator()
-    gen._generators.generate_email = AsyncMock(return_value=[])
+async def test_generate_email_empty_list(async_gen):
+    gen = async_gen
+    gen._generators.generate_email.return_value = []
 
     with pytest.raises(RuntimeError, match="no valid addresses"):
         await gen.generate_email()
 
 @pytest.mark.asyncio
-async def test_generate_email_none_returned():
-    gen = await AsyncEmailGenerator()
-    gen._generators.generate_email = AsyncMock(return_value=None)
+async def test_generate_email_none_returned(async_gen):
+    gen = async_gen
+    gen._generators.generate_email.return_value = None
 
     with pytest.raises(RuntimeError, match="no valid addresses"):
         await gen.generate_email()
 
 @pytest.mark.asyncio
-async def test_generate_email_raises_from_inner():
-    gen = await AsyncEmailGenerator()
+async def test_generate_email_raises_from_inner(async_gen):
+    gen = async_gen
 
     async def fail():
         raise RuntimeError("Internal failure")
@@ -0,0 +1,67 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from emailnator.asyncio.generators import Generators
+
+
+@pytest.mark.asyncio
+class TestGeneratorsGenerateManyBulk:
+
+    async def test_batches_are_flattened_in_order(self):
+        """Should return emails from every batch as one flat list."""
+        gen = Generators.__new__(Generators)
+        gen.generate_bulk_emails = AsyncMock(
+            side_effect=[["a@gmail.com", "b@gmail.com"], ["c@gmail.com"]]
+        )
+
+        result = await gen.generate_many_bulk(2, "100")
+
+        assert result == ["a@gmail.com", "b@gmail.com", "c@gmail.com"]
+        assert gen.generate_bulk_emails.await_count == 2
+
+    async def test_concurrency_is_bounded(self):
+        """Should never run more than max_concurrent requests at once."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_bulk(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return ["a@gmail.com"]
+
+        gen = Generators.__new__(Generators)
+        gen.generate_bulk_emails = fake_bulk
+
+        result = await gen.generate_many_bulk(10, max_concurrent=3)
+
+        assert len(result) == 10
+        assert peak == 3
+
+    async def test_invalid_batches_raises_valueerror(self):
+        """Should raise ValueError when batches is not positive."""
+        gen = Generators.__new__(Generators)
+
+        with pytest.raises(ValueError, match="batches"):
+            await gen.generate_many_bulk(0)
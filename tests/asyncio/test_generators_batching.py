@@ -0,0 +1,128 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import json
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def batching(generators):
+    generators.batch_requests = True
+    return generators
+
+
+@pytest.mark.asyncio
+class TestGeneratorsBatching:
+
+    async def test_batching_is_off_by_default(self, generators):
+        """Should send one single-email request per call unless enabled."""
+        gen = generators
+        gen.backend.post.return_value = httpx.Response(
+            200, json={"email": ["a@gmail.com"]}
+        )
+
+        results = await asyncio.gather(*(gen.generate_email() for _ in range(5)))
+
+        assert results == [["a@gmail.com"]] * 5
+        assert gen.backend.post.await_count == 5
+        for call in gen.backend.post.await_args_list:
+            assert "emailNo" not in json.loads(call.kwargs["content"])
+        assert not gen._batches
+
+    async def test_concurrent_calls_share_one_bulk_request(self, batching):
+        """Should serve concurrent callers from one bulk request of an allowed size."""
+        gen = batching
+        emails = [f"{c}@gmail.com" for c in "abcdefg"]
+        gen.backend.post.return_value = httpx.Response(200, json={"email": emails})
+
+        results = await asyncio.gather(*(gen.generate_email() for _ in range(5)))
+
+        assert results == [[email] for email in emails[:5]]
+        gen.backend.post.assert_awaited_once()
+        assert json.loads(gen.backend.post.await_args.kwargs["content"])["emailNo"] == "100"
+
+    async def test_surplus_serves_later_callers(self, batching):
+        """Should hand leftover bulk addresses to later callers without a request."""
+        gen = batching
+        emails = [f"{c}@gmail.com" for c in "abcdefg"]
+        gen.backend.post.return_value = httpx.Response(200, json={"email": emails})
+        await asyncio.gather(*(gen.generate_email() for _ in range(5)))
+
+        result = await gen.generate_email()
+
+        assert result == ["f@gmail.com"]
+        gen.backend.post.assert_awaited_once()
+
+    async def test_small_batch_uses_single_requests(self, batching):
+        """Should not request a bulk batch below `batch_bulk_threshold`."""
+        gen = batching
+        gen.backend.post.return_value = httpx.Response(
+            200, json={"email": ["a@gmail.com"]}
+        )
+
+        results = await asyncio.gather(gen.generate_email(), gen.generate_email())
+
+        assert results == [["a@gmail.com"], ["a@gmail.com"]]
+        assert gen.backend.post.await_count == 2
+        for call in gen.backend.post.await_args_list:
+            assert "emailNo" not in json.loads(call.kwargs["content"])
+
+    async def test_ttl_bypasses_batching(self, batching):
+        """Should not coalesce calls that use the result cache."""
+        gen = batching
+        gen.backend.post.return_value = httpx.Response(
+            200, json={"email": ["a@gmail.com"]}
+        )
+
+        await asyncio.gather(*(gen.generate_email(ttl=60) for _ in range(5)))
+
+        assert not gen._batches
+        for call in gen.backend.post.await_args_list:
+            assert "emailNo" not in json.loads(call.kwargs["content"])
+
+    async def test_full_batch_is_flushed_without_waiting(self, batching):
+        """Should flush as soon as batch_max_size callers are waiting."""
+        gen = batching
+        gen.backend.post.return_value = httpx.Response(
+            200, json={"email": ["a@gmail.com", "b@gmail.com"]}
+        )
+        gen.batch_max_size = 2
+        gen.batch_bulk_threshold = 2
+
+        results = await asyncio.wait_for(
+            asyncio.gather(gen.generate_email(), gen.generate_email()),
+            timeout=1
+        )
+
+        assert results == [["a@gmail.com"], ["b@gmail.com"]]
+
+    async def test_errors_reach_every_caller(self, batching):
+        """Should propagate a failed bulk request to all waiting callers."""
+        gen = batching
+        gen.backend.post.return_value = httpx.Response(500, text="boom")
+
+        results = await asyncio.gather(
+            *(gen.generate_email() for _ in range(5)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,55 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def gen(generators):
+    generators.backend.post.return_value = httpx.Response(
+        200, json={"email": ["a@gmail.com"]}
+    )
+    return generators
+
+
+@pytest.mark.asyncio
+class TestGeneratorsCache:
+
+    async def test_without_ttl_every_call_hits_api(self, gen):
+        """Should call the API every time when caching is disabled."""
+        await gen.generate_email()
+        await gen.generate_email()
+
+        assert gen.backend.post.await_count == 2
+
+    async def test_with_ttl_repeated_call_is_cached(self, gen):
+        """Should reuse the parsed result within the TTL."""
+        first = await gen.generate_bulk_emails("100", ttl=60)
+        second = await gen.generate_bulk_emails("100", ttl=60)
+
+        assert first == second == ["a@gmail.com"]
+        assert first is not second
+        gen.backend.post.assert_awaited_once()
+
+    async def test_cache_is_keyed_by_emails_number(self, gen):
+        """Should not share cached results between different counts."""
+        await gen.generate_bulk_emails("100", ttl=60)
+        await gen.generate_bulk_emails("200", ttl=60)
+
+        assert gen.backend.post.await_count == 2
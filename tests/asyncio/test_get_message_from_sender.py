@@ -1,41 +1,54 @@
 import pytest
 from unittest.mock import AsyncMock
 
-from emailnator.asyncio.email_generator import AsyncEmailGenerator
 
 
 @pytest.mark.asyncio
-async def test_get_message_from_sender_success():
-    generator = await AsyncEmailGenerator()
-    generator.get_messages = AsyncMock(return_value=[
+async def test_get_message_from_sender_success(async_gen):
+    generator = async_gen
+    generator._get_messages_raw = AsyncMock(return_value=[
         {'messageID': '123', 'from': 'Bob', 'subject': 'Hello'}
     ])
-    generator.get_message = AsyncMock(return_value="This is the message text")
+    generator._get_message_raw = AsyncMock(return_value="This is the message text")
 
     result = await generator.get_message_from_sender('Bob', 'test@example.com')
     assert result == "This is the message text"
-    generator.get_messages.assert_awaited_once_with('test@example.com')
-    generator.get_message.assert_awaited_once_with('test@example.com', '123')
+    generator._get_messages_raw.assert_awaited_once_with('test@example.com')
+    generator._get_message_raw.assert_awaited_once_with('test@example.com', '123')
 
 
 @pytest.mark.asyncio
-async def test_get_message_from_sender_not_found():
-    generator = await AsyncEmailGenerator()
-    generator.get_messages = AsyncMock(return_value=[
+async def test_get_message_from_sender_matches_exact_from(async_gen):
+    generator = async_gen
+    generator._get_messages_raw = AsyncMock(return_value=[
+        {'messageID': '123', 'from': 'Bob', 'subject': 'Hello'},
+        {'messageID': '456', 'from': 'Bob <bob@example.com>', 'subject': 'Hi'},
+    ])
+    generator._get_message_raw = AsyncMock(return_value="This is the message text")
+
+    result = await generator.get_message_from_sender('Bob <bob@example.com>', 'test@example.com')
+    assert result == "This is the message text"
+    generator._get_message_raw.assert_awaited_once_with('test@example.com', '456')
+
+
+@pytest.mark.asyncio
+async def test_get_message_from_sender_not_found(async_gen):
+    generator = async_gen
+    generator._get_messages_raw = AsyncMock(return_value=[
         {'messageID': '123', 'from': 'Alice', 'subject': 'Hello'}
     ])
-    generator.get_message = AsyncMock()
+    generator._get_message_raw = AsyncMock()
 
     result = await generator.get_message_from_sender('Bob', 'test@example.com')
     assert result is None
-    generator.get_message.assert_not_awaited()
+    generator._get_message_raw.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_get_message_from_sender_invalid_sender_email():
-    generator = await AsyncEmailGenerator()
-    generator.get_messages = AsyncMock()
-    generator.get_message = AsyncMock()
+async def test_get_message_from_sender_invalid_sender_email(async_gen):
+    generator = async_gen
+    generator._get_messages_raw = AsyncMock()
+    generator._get_message_raw = AsyncMock()
 
     with pytest.raises(ValueError):
         await generator.get_message_from_sender('', 'test@example.com')
@@ -51,23 +64,23 @@ async def test_get_message_from_sender_invalid_sender_email():
 
 
 @pytest.mark.asyncio
-async def test_get_message_from_sender_invalid_messages_return():
-    generator = await AsyncEmailGenerator()
-    generator.get_messages = AsyncMock(return_value="not a list")
-    generator.get_message = AsyncMock()
+async def test_get_message_from_sender_invalid_messages_return(async_gen):
+    generator = async_gen
+    generator._get_messages_raw = AsyncMock(return_value="not a list")
+    generator._get_message_raw = AsyncMock()
 
     with pytest.raises(ValueError):
         await generator.get_message_from_sender('Bob', 'test@example.com')
 
 
 @pytest.mark.asyncio
-async def test_get_message_from_sender_message_without_id():
-    generator = await AsyncEmailGenerator()
-    generator.get_messages = AsyncMock(return_value=[
+async def test_get_message_from_sender_message_without_id(async_gen):
+    generator = async_gen
+    generator._get_messages_raw = AsyncMock(return_value=[
         {'from': 'Bob', 'subject': 'Hello'}
     ])
-    generator.get_message = AsyncMock()
+    generator._get_message_raw = AsyncMock()
 
     result = await generator.get_message_from_sender('Bob', 'test@example.com')
     assert result is None
-    generator.get_message.assert_not_awaited()
+    generator._get_message_raw.assert_not_awaited()
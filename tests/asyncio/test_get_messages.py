@@ -17,52 +17,45 @@
 # <https://www.gnu.org/licenses/>.
 
 import pytest
-from unittest.mock import AsyncMock
-from emailnator.asyncio.email_generator import AsyncEmailGenerator
 
-@pytest.mark.asyncio
+
+pytestmark = pytest.mark.asyncio
+
+
 class TestAsyncEmailGeneratorGetMessages:
 
-    async def test_valid_email_returns_messages(self):
+    async def test_valid_email_returns_messages(self, async_gen):
         """Should return a list of message dicts when email is valid."""
-        mock_message_getter = AsyncMock()
-        mock_message_getter.get_message_list.return_value = [
+        gen = async_gen
+        gen._message_getter.get_message_list.return_value = [
             {"messageID": "abc123", "from": "AI Tools", "subject": "Hello", "time": "Now"}
         ]
 
-        gen = await AsyncEmailGenerator()
-        gen._message_getter = mock_message_getter
-
         result = await gen.get_messages("user@example.com")
 
         assert isinstance(result, list)
         assert all(isinstance(m, dict) for m in result)
         assert result[0]["messageID"] == "abc123"
-        mock_message_getter.get_message_list.assert_awaited_once_with("user@example.com")
+        gen._message_getter.get_message_list.assert_awaited_once_with("user@example.com")
 
-    async def test_empty_email_raises_valueerror(self):
+    async def test_empty_email_raises_valueerror(self, async_gen):
         """Should raise ValueError if email is empty."""
-        gen = await AsyncEmailGenerator()
-        gen._message_getter = AsyncMock()
+        gen = async_gen
 
         with pytest.raises(ValueError, match="non-empty string"):
             await gen.get_messages("")
 
-    async def test_invalid_email_format_raises_valueerror(self):
+    async def test_invalid_email_format_raises_valueerror(self, async_gen):
         """Should raise ValueError if email format is invalid."""
-        gen = await AsyncEmailGenerator()
-        gen._message_getter = AsyncMock()
+        gen = async_gen
 
         with pytest.raises(ValueError, match="Invalid email format"):
             await gen.get_messages("invalid-email")
 
-    async def test_message_getter_raises_runtimeerror(self):
+    async def test_message_getter_raises_runtimeerror(self, async_gen):
         """Should propagate RuntimeError if message_getter fails."""
-        mock_message_getter = AsyncMock()
-        mock_message_getter.get_message_list.side_effect = RuntimeError("API down")
-
-        gen = await AsyncEmailGenerator()
-        gen._message_getter = mock_message_getter
+        gen = async_gen
+        gen._message_getter.get_message_list.side_effect = RuntimeError("API down")
 
         with pytest.raises(RuntimeError, match="API down"):
             await gen.get_messages("user@example.com")
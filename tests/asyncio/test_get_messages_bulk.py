@@ -0,0 +1,91 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from emailnator.asyncio.email_generator import AsyncEmailGenerator
+
+
+def make_generator(get_message) -> AsyncEmailGenerator:
+    gen = AsyncEmailGenerator.__new__(AsyncEmailGenerator)
+    gen._message_getter = AsyncMock()
+    gen._message_getter.get_message.side_effect = get_message
+    return gen
+
+
+@pytest.mark.asyncio
+class TestAsyncEmailGeneratorGetMessagesBulk:
+
+    async def test_returns_messages_in_order(self):
+        """Should return message contents in the order of the IDs."""
+        async def get_message(email, message_id):
+            await asyncio.sleep(0.01 if message_id == "a" else 0)
+            return f"<html>{message_id}</html>"
+
+        gen = make_generator(get_message)
+
+        result = await gen.get_messages_bulk("test@gmail.com", ["a", "b"])
+
+        assert result == ["<html>a</html>", "<html>b</html>"]
+
+    async def test_failure_is_returned_in_place(self):
+        """Should return the exception of a failed fetch without dropping others."""
+        error = RuntimeError("boom")
+
+        async def get_message(email, message_id):
+            if message_id == "bad":
+                raise error
+            return "ok"
+
+        gen = make_generator(get_message)
+
+        result = await gen.get_messages_bulk("test@gmail.com", ["bad", "good"])
+
+        assert result == [error, "ok"]
+
+    async def test_concurrency_is_bounded(self):
+        """Should never run more than max_concurrent fetches at once."""
+        in_flight = 0
+        peak = 0
+
+        async def get_message(email, message_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return "ok"
+
+        gen = make_generator(get_message)
+
+        await gen.get_messages_bulk(
+            "test@gmail.com", [str(i) for i in range(8)], max_concurrent=3
+        )
+
+        assert peak == 3
+
+    async def test_invalid_message_ids_raise_valueerror(self):
+        """Should reject empty message IDs before sending any request."""
+        gen = make_generator(AsyncMock())
+
+        with pytest.raises(ValueError, match="Message IDs"):
+            await gen.get_messages_bulk("test@gmail.com", ["a", ""])
+
+        gen._message_getter.get_message.assert_not_awaited()
@@ -0,0 +1,94 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+from emailnator.asyncio.email_generator import AsyncEmailGenerator
+
+
+MESSAGES = [
+    {"from": "AI Tools <news@aitools.com>", "messageID": "1"},
+    {"from": "Service <noreply@service.com>", "messageID": "2"},
+    {"from": "ai tools <news@aitools.com>", "messageID": "3"},
+    {"from": "No ID <noid@example.com>"},
+]
+
+
+def make_generator() -> AsyncEmailGenerator:
+    gen = AsyncEmailGenerator.__new__(AsyncEmailGenerator)
+    gen._index_cache = OrderedDict()
+    gen._message_getter = AsyncMock()
+    gen._message_getter.get_message_list.return_value = MESSAGES
+    return gen
+
+
+@pytest.mark.asyncio
+class TestAsyncEmailGeneratorGetMessagesIndex:
+
+    async def test_index_keeps_first_message_per_sender(self):
+        """Should map lower-cased senders to their first message ID."""
+        gen = make_generator()
+
+        index = await gen.get_messages_index("test@gmail.com")
+
+        assert index == {
+            "ai tools <news@aitools.com>": "1",
+            "service <noreply@service.com>": "2",
+        }
+
+    async def test_keys_are_exact_full_senders(self):
+        """Should not match a sender name or address on its own."""
+        gen = make_generator()
+
+        index = await gen.get_messages_index("test@gmail.com")
+
+        assert "ai tools" not in index
+        assert "news@aitools.com" not in index
+
+    async def test_index_is_cached_within_ttl(self):
+        """Should fetch the message list once for repeated lookups."""
+        gen = make_generator()
+
+        await gen.get_messages_index("test@gmail.com", ttl=5)
+        await gen.get_messages_index("test@gmail.com", ttl=5)
+
+        gen._message_getter.get_message_list.assert_awaited_once()
+
+    async def test_default_always_refetches(self):
+        """Should not cache the index by default so new mail is seen."""
+        gen = make_generator()
+
+        await gen.get_messages_index("test@gmail.com")
+        await gen.get_messages_index("test@gmail.com")
+
+        assert gen._message_getter.get_message_list.await_count == 2
+        assert not gen._index_cache
+
+    async def test_cache_evicts_least_recently_used(self):
+        """Should keep at most `index_cache_size` mailboxes."""
+        gen = make_generator()
+        gen.index_cache_size = 2
+
+        await gen.get_messages_index("a@gmail.com", ttl=5)
+        await gen.get_messages_index("b@gmail.com", ttl=5)
+        await gen.get_messages_index("a@gmail.com", ttl=5)
+        await gen.get_messages_index("c@gmail.com", ttl=5)
+
+        assert list(gen._index_cache) == ["a@gmail.com", "c@gmail.com"]
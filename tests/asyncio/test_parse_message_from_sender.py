@@ -1,49 +1,72 @@
 import pytest
 
-from emailnator.asyncio.email_generator import AsyncEmailGenerator
 
 
 @pytest.mark.asyncio
-async def test_parse_message_from_sender_valid():
+async def test_parse_message_from_sender_valid(async_gen):
     messages = [
         {'messageID': '1', 'from': 'Alice', 'subject': 'Hello'},
         {'messageID': '2', 'from': 'Bob', 'subject': 'Hi'},
     ]
-    generator = await AsyncEmailGenerator()
+    generator = async_gen
     result = await generator.parse_message_from_sender(messages, 'Bob')
     assert result == '2'
 
 
 @pytest.mark.asyncio
-async def test_parse_message_from_sender_not_found():
+async def test_parse_message_from_sender_matches_substring_ignoring_case(async_gen):
     messages = [
         {'messageID': '1', 'from': 'Alice', 'subject': 'Hello'},
+        {'messageID': '2', 'from': 'AI Tools <news@aitools.com>', 'subject': 'Hi'},
     ]
-    generator = await AsyncEmailGenerator()
+    generator = async_gen
+    result = await generator.parse_message_from_sender(messages, 'AI TOOLS')
+    assert result == '2'
+
+
+@pytest.mark.asyncio
+async def test_parse_message_from_sender_matches_exact_from(async_gen):
+    messages = [
+        {'messageID': '1', 'from': 'AI Tools', 'subject': 'Hello'},
+        {'messageID': '2', 'from': 'AI Tools <news@aitools.com>', 'subject': 'Hi'},
+    ]
+    generator = async_gen
+    result = await generator.parse_message_from_sender(
+        messages, 'AI Tools <news@aitools.com>'
+    )
+    assert result == '2'
+
+
+@pytest.mark.asyncio
+async def test_parse_message_from_sender_not_found(async_gen):
+    messages = [
+        {'messageID': '1', 'from': 'Alice', 'subject': 'Hello'},
+    ]
+    generator = async_gen
     result = await generator.parse_message_from_sender(messages, 'Bob')
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_parse_message_from_sender_empty_messages():
-    generator = await AsyncEmailGenerator()
+async def test_parse_message_from_sender_empty_messages(async_gen):
+    generator = async_gen
     with pytest.raises(ValueError):
         await generator.parse_message_from_sender([], 'Alice')
 
 
 @pytest.mark.asyncio
-async def test_parse_message_from_sender_invalid_messages_type():
-    generator = await AsyncEmailGenerator()
+async def test_parse_message_from_sender_invalid_messages_type(async_gen):
+    generator = async_gen
     with pytest.raises(ValueError):
         await generator.parse_message_from_sender("not a list", 'Alice')
 
 
 @pytest.mark.asyncio
-async def test_parse_message_from_sender_invalid_sender_type():
+async def test_parse_message_from_sender_invalid_sender_type(async_gen):
     messages = [
         {'messageID': '1', 'from': 'Alice', 'subject': 'Hello'},
     ]
-    generator = await AsyncEmailGenerator()
+    generator = async_gen
     with pytest.raises(ValueError):
         await generator.parse_message_from_sender(messages, '')
     with pytest.raises(ValueError):
@@ -0,0 +1,77 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import pytest
+from emailnator.asyncio import email_generator
+from emailnator.asyncio.email_generator import AsyncEmailGenerator
+
+
+MESSAGES = [
+    {"from": "Alice <alice@example.com>", "messageID": "1"},
+    {"from": "AI Tools <news@aitools.com>", "messageID": "2"},
+    {"from": "ai tools <news@aitools.com>", "messageID": "3"},
+    {"from": "No ID <noid@example.com>"},
+]
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def gen(request, monkeypatch):
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(email_generator, "ahocorasick", None)
+    gen = AsyncEmailGenerator.__new__(AsyncEmailGenerator)
+    return gen
+
+
+@pytest.mark.asyncio
+class TestAsyncEmailGeneratorParseMessagesFromSenders:
+
+    async def test_returns_first_match_per_sender(self, gen):
+        """Should map each sender to its first matching message, ignoring case."""
+        result = await gen.parse_messages_from_senders(
+            MESSAGES, ["AI TOOLS", "alice", "Bob", "noid@"]
+        )
+
+        assert result == {"AI TOOLS": "2", "alice": "1", "Bob": None, "noid@": None}
+
+    async def test_matches_single_sender_lookup(self, gen):
+        """Should agree with parse_message_from_sender for every sender."""
+        senders = ["Tools", "example.com", "news@", "missing"]
+
+        result = await gen.parse_messages_from_senders(MESSAGES, senders)
+
+        for sender in senders:
+            assert result[sender] == await gen.parse_message_from_sender(MESSAGES, sender)
+
+    async def test_overlapping_senders_are_all_found(self, gen):
+        """Should find senders that overlap inside one 'from' field."""
+        result = await gen.parse_messages_from_senders(
+            MESSAGES, ["news@aitools.com", "aitools", "tools.com"]
+        )
+
+        assert set(result.values()) == {"2"}
+
+    async def test_invalid_input_raises_valueerror(self, gen):
+        """Should reject invalid messages or senders."""
+        with pytest.raises(ValueError):
+            await gen.parse_messages_from_senders("not a list", ["Alice"])
+        with pytest.raises(ValueError):
+            await gen.parse_messages_from_senders(MESSAGES, ["Alice", ""])
+        with pytest.raises(ValueError):
+            await gen.parse_messages_from_senders(MESSAGES, "Alice")
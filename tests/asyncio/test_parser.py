@@ -0,0 +1,58 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import httpx
+import pytest
+from emailnator.asyncio.helpers.parser import Parser
+
+
+class TestParser:
+
+    def test_parse_email_response_returns_emails(self):
+        response = httpx.Response(200, json={"email": ["a@gmail.com"]})
+        assert Parser.parse_email_response(response, "generate-email") == ["a@gmail.com"]
+
+    def test_parse_email_response_wraps_single_email(self):
+        response = httpx.Response(200, json={"email": "a@gmail.com"})
+        assert Parser.parse_email_response(response, "generate-email") == ["a@gmail.com"]
+
+    def test_parse_message_response_returns_messages(self):
+        messages = [{"messageID": "1", "from": "Bob"}]
+        response = httpx.Response(200, json={"messageData": messages})
+        assert Parser.parse_message_response(response, "message-list") == messages
+
+    def test_error_status_raises_with_truncated_body(self):
+        response = httpx.Response(500, content=b"x" * 1000)
+        with pytest.raises(RuntimeError, match="returned 500") as exc_info:
+            Parser.parse_email_response(response, "generate-email")
+        assert str(exc_info.value).count("x") == 400
+
+    def test_invalid_json_raises(self):
+        response = httpx.Response(200, content=b"<html>")
+        with pytest.raises(RuntimeError, match="not valid JSON: <html>"):
+            Parser.parse_message_response(response, "message-list")
+
+    def test_invalid_message_data_raises(self):
+        response = httpx.Response(200, json={"messageData": ["not a dict"]})
+        with pytest.raises(RuntimeError, match="messageData"):
+            Parser.parse_message_response(response, "message-list")
+
+    def test_non_object_json_raises(self):
+        response = httpx.Response(200, json=["a@gmail.com"])
+        with pytest.raises(RuntimeError, match="'email'"):
+            Parser.parse_email_response(response, "generate-email")
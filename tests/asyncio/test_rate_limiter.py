@@ -0,0 +1,125 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from emailnator.asyncio.helpers.rate_limiter import (
+    AsyncRateLimiter,
+    get_host_limiter,
+)
+from emailnator.config.config import config
+
+
+@pytest.mark.asyncio
+class TestAsyncRateLimiter:
+
+    async def test_burst_within_rate_does_not_wait(self):
+        """Should let up to `rate` requests through immediately."""
+        limiter = AsyncRateLimiter(5)
+        start = time.monotonic()
+
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    async def test_waits_when_bucket_is_empty(self):
+        """Should delay requests beyond the burst until a token refills."""
+        limiter = AsyncRateLimiter(2, period=0.1)
+        start = time.monotonic()
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    async def test_cancelled_waiter_returns_its_token(self):
+        """Should give the reserved token back when a waiter is cancelled."""
+        limiter = AsyncRateLimiter(1, period=60)
+        await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter._tokens >= 0
+
+    async def test_invalid_rate_raises_valueerror(self):
+        """Should reject a non-positive rate."""
+        with pytest.raises(ValueError, match="rate"):
+            AsyncRateLimiter(0)
+
+
+class TestGetHostLimiter:
+
+    def test_disabled_when_rate_is_zero(self):
+        """Should not limit requests unless a positive rate is configured."""
+        assert get_host_limiter("https://www.emailnator.com/x", 0) is None
+        assert config.RATE_LIMIT == 0
+
+    def test_shared_per_host(self):
+        """Should hand every caller of one host the same limiter."""
+        first = get_host_limiter("https://shared.example/generate-email", 5)
+        second = get_host_limiter("https://shared.example/message-list", 5)
+        other = get_host_limiter("https://other.example/generate-email", 5)
+
+        assert first is second
+        assert first is not other
+
+    def test_replaced_when_rate_changes(self):
+        """Should build a new limiter when the configured rate changes."""
+        first = get_host_limiter("https://rate.example/", 5)
+        second = get_host_limiter("https://rate.example/", 7)
+
+        assert second is not first
+        assert second.rate == 7
+
+
+@pytest.mark.asyncio
+class TestGeneratorsRetry:
+
+    async def test_retries_after_429(self, generators):
+        """Should retry a rate-limited request and return the next response."""
+        gen = generators
+        gen.backend.post.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"email": ["a@gmail.com"]}),
+        ]
+
+        result = await gen.generate_bulk_emails("100")
+
+        assert result == ["a@gmail.com"]
+        assert gen.backend.post.await_count == 2
+
+    async def test_gives_up_after_max_retries(self, generators):
+        """Should stop retrying after `config.MAX_RETRIES` attempts."""
+        gen = generators
+        gen.backend.post.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "0"})
+            for _ in range(config.MAX_RETRIES + 1)
+        ]
+
+        with pytest.raises(RuntimeError):
+            await gen.generate_bulk_emails("100")
+
+        assert gen.backend.post.await_count == config.MAX_RETRIES + 1
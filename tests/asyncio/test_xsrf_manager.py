@@ -0,0 +1,200 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+import httpx
+import pytest
+from emailnator.asyncio.builders.helpers.xsrf_token_service import XsrfManager
+
+
+def make_client() -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"Set-Cookie": "XSRF-TOKEN=abc%3D%3D; Path=/"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+class TestXsrfManager:
+
+    async def test_headers_contain_decoded_token(self):
+        """Should build the request headers around the decoded token."""
+        async with make_client() as client:
+            headers = await XsrfManager(client).get_headers()
+
+        assert headers["X-XSRF-TOKEN"] == "abc=="
+        assert headers["X-Requested-With"] == "XMLHttpRequest"
+        assert headers["Content-Type"] == "application/json"
+
+    async def test_get_headers_returns_independent_copies(self):
+        """Should not let callers modify the manager's headers."""
+        async with make_client() as client:
+            manager = XsrfManager(client)
+            first = await manager.get_headers()
+            first["X-XSRF-TOKEN"] = "changed"
+            second = await manager.get_headers()
+
+        assert second["X-XSRF-TOKEN"] == "abc=="
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        """Should fetch the token once for a burst of first callers."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200, headers={"Set-Cookie": "XSRF-TOKEN=abc; Path=/"}
+            )
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            manager = XsrfManager(client)
+            tokens = await asyncio.gather(
+                *(manager.get_token() for _ in range(10))
+            )
+
+        assert tokens == ["abc"] * 10
+        assert calls == 1
+
+    async def test_failed_initialization_is_retried(self):
+        """Should start a new fetch after a failed initialization."""
+        cookie_set = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if not cookie_set:
+                return httpx.Response(200)
+            return httpx.Response(200, headers={"Set-Cookie": "XSRF-TOKEN=abc"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            manager = XsrfManager(client)
+            with pytest.raises(RuntimeError, match="not found"):
+                await manager.get_token()
+            cookie_set = True
+            assert await manager.get_token() == "abc"
+
+    async def test_token_is_fetched_with_get_by_default(self):
+        """Should not send HEAD unless XSRF_USE_HEAD is enabled."""
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200, headers={"Set-Cookie": "XSRF-TOKEN=abc"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            assert await XsrfManager(client).get_token() == "abc"
+
+        assert methods == ["GET"]
+
+    async def test_token_is_fetched_with_head(self, monkeypatch):
+        """Should not fall back to GET when HEAD carries the token."""
+        monkeypatch.setattr(XsrfManager, "_USE_HEAD", True)
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200, headers={"Set-Cookie": "XSRF-TOKEN=abc"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            assert await XsrfManager(client).get_token() == "abc"
+
+        assert methods == ["HEAD"]
+
+    async def test_falls_back_to_get_without_head_cookie(self, monkeypatch):
+        """Should fetch the page with GET when HEAD sets no token."""
+        monkeypatch.setattr(XsrfManager, "_USE_HEAD", True)
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(200, headers={"Set-Cookie": "XSRF-TOKEN=abc"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            assert await XsrfManager(client).get_token() == "abc"
+
+        assert methods == ["HEAD", "GET"]
+
+    async def test_falls_back_to_get_when_head_raises(self, monkeypatch):
+        """Should fetch the page with GET when the HEAD request fails."""
+        monkeypatch.setattr(XsrfManager, "_USE_HEAD", True)
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            if request.method == "HEAD":
+                raise httpx.ConnectError("reset", request=request)
+            return httpx.Response(200, headers={"Set-Cookie": "XSRF-TOKEN=abc"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            assert await XsrfManager(client).get_token() == "abc"
+
+        assert methods == ["HEAD", "GET"]
+
+    async def test_stale_token_is_refreshed_on_demand(self):
+        """Should fetch a new token once the current one is too old."""
+        tokens = iter(["first", "second"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"Set-Cookie": f"XSRF-TOKEN={next(tokens)}"}
+            )
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            manager = XsrfManager(client)
+            assert (await manager.get_headers())["X-XSRF-TOKEN"] == "first"
+            assert (await manager.get_headers())["X-XSRF-TOKEN"] == "first"
+            manager._fetched_at -= manager.token_max_age
+            assert (await manager.get_headers())["X-XSRF-TOKEN"] == "second"
+
+    async def test_failed_refresh_keeps_previous_headers(self):
+        """Should keep serving the old token when a refresh fails."""
+        fail = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if fail:
+                raise httpx.ConnectError("offline", request=request)
+            return httpx.Response(200, headers={"Set-Cookie": "XSRF-TOKEN=abc"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            manager = XsrfManager(client)
+            await manager.get_headers()
+            fail = True
+            manager._fetched_at -= manager.token_max_age
+            headers = await manager.get_headers()
+
+        assert headers["X-XSRF-TOKEN"] == "abc"
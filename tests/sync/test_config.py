@@ -0,0 +1,92 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+from emailnator.config import config as config_module
+from emailnator.config.config import load_config
+
+
+def test_load_config_reuses_unchanged_file(tmp_path):
+    """Should return the cached config while the file is unchanged."""
+    path = tmp_path / "config.yaml"
+    path.write_text("TIMEOUT: 5\n", encoding="utf-8")
+
+    assert load_config(path) is load_config(path)
+
+
+def test_load_config_reparses_modified_file(tmp_path):
+    """Should parse the file again once its modification time changes."""
+    path = tmp_path / "config.yaml"
+    path.write_text("TIMEOUT: 5\n", encoding="utf-8")
+    first = load_config(path)
+
+    path.write_text("TIMEOUT: 7\n", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_config(path)
+    assert second is not first
+    assert second.TIMEOUT == 7
+
+
+def test_load_config_writes_nothing_next_to_the_file(tmp_path):
+    """Should leave the configuration directory untouched."""
+    path = tmp_path / "config.yaml"
+    path.write_text("TIMEOUT: 5\n", encoding="utf-8")
+    load_config.cache_clear()
+
+    load_config(path)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+
+def test_load_config_reads_packaged_resource(monkeypatch):
+    """Should load the packaged config.yaml when it has no filesystem path."""
+    monkeypatch.setattr(config_module, "_DEFAULT_CONFIG_PATH", None)
+    load_config.cache_clear()
+
+    first = load_config()
+
+    assert first.BASE_URL == "https://www.emailnator.com"
+    assert load_config() is first
+    load_config.cache_clear()
+
+
+def test_config_has_no_instance_dict(tmp_path):
+    """Should store settings in slots and reject unknown attributes."""
+    path = tmp_path / "config.yaml"
+    path.write_text("TIMEOUT: 5\n", encoding="utf-8")
+    loaded = load_config(path)
+
+    assert not hasattr(loaded, "__dict__")
+    with pytest.raises(AttributeError):
+        loaded.TIMEOUTS = 5
+
+
+def test_gmail_config_is_a_list(tmp_path):
+    """Should expose GMAIL_CONFIG as a list, as before memoization."""
+    path = tmp_path / "config.yaml"
+    path.write_text("GMAIL_CONFIG: [dotGmail]\n", encoding="utf-8")
+
+    loaded = load_config(path)
+
+    assert loaded.GMAIL_CONFIG == ["dotGmail"]
+    assert isinstance(loaded.GMAIL_CONFIG, list)
@@ -0,0 +1,73 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+import concurrent.futures
+
+from emailnator.sync import email_generator
+from emailnator.sync.email_generator import EmailGenerator
+
+
+def test_shutdown_stops_loop_that_was_never_released():
+    loop = email_generator._acquire_loop()
+    thread = email_generator._GLOBAL_THREAD
+
+    email_generator._shutdown_loop()
+
+    assert not thread.is_alive()
+    assert loop.is_closed()
+    assert email_generator._GLOBAL_LOOP is None
+    assert email_generator._GLOBAL_USERS == 0
+
+
+def test_release_after_shutdown_is_harmless():
+    email_generator._acquire_loop()
+    email_generator._shutdown_loop()
+
+    email_generator._release_loop()
+
+    assert email_generator._GLOBAL_USERS == 0
+
+
+def test_last_release_stops_loop():
+    loop = email_generator._acquire_loop()
+    email_generator._acquire_loop()
+    thread = email_generator._GLOBAL_THREAD
+
+    email_generator._release_loop()
+    assert thread.is_alive()
+
+    email_generator._release_loop()
+    assert not thread.is_alive()
+    assert loop.is_closed()
+
+
+def test_run_from_loop_thread_raises_instead_of_deadlocking(background_loop):
+    gen = EmailGenerator.__new__(EmailGenerator)
+    gen._loop = background_loop
+    outcome = concurrent.futures.Future()
+
+    def callback():
+        try:
+            gen._run(asyncio.sleep(0))
+        except RuntimeError as exc:
+            outcome.set_result(exc)
+
+    background_loop.call_soon_threadsafe(callback)
+
+    assert "event loop thread" in str(outcome.result(timeout=1))
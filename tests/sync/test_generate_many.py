@@ -0,0 +1,53 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from unittest.mock import AsyncMock
+from emailnator.sync.email_generator import EmailGenerator
+
+
+@pytest.fixture
+def email_gen(background_loop):
+    gen = EmailGenerator.__new__(EmailGenerator)
+    gen._loop = background_loop
+    gen._async = AsyncMock()
+    return gen
+
+
+def test_generate_many_returns_all_emails(email_gen):
+    email_gen._async.generate_email.side_effect = [
+        "a@gmail.com", "b@gmail.com", "c@gmail.com"
+    ]
+
+    result = email_gen.generate_many(3)
+
+    assert result == ["a@gmail.com", "b@gmail.com", "c@gmail.com"]
+    assert email_gen._async.generate_email.await_count == 3
+
+
+def test_generate_many_rejects_invalid_count(email_gen):
+    with pytest.raises(ValueError):
+        email_gen.generate_many(0)
+
+
+def test_generate_many_raises_on_invalid_email(email_gen):
+    email_gen._async.generate_email.return_value = "not-an-email"
+
+    with pytest.raises(RuntimeError, match="Invalid email format"):
+        email_gen.generate_many(2)
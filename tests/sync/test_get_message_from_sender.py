@@ -13,10 +13,9 @@ class DummyAsync:
         return None
 
 @pytest.fixture
-def email_gen():
-    import asyncio
+def email_gen(background_loop):
     gen = EmailGenerator.__new__(EmailGenerator)  # минуем __init__
-    gen._loop = asyncio.get_event_loop()
+    gen._loop = background_loop
     dummy_async = DummyAsync()
     gen._async = cast(AsyncEmailGenerator, dummy_async)
     return gen
@@ -1,4 +1,3 @@
-import asyncio
 from unittest.mock import AsyncMock
 from typing import cast
 import pytest
@@ -12,7 +11,7 @@ class DummyAsync:
                 return msg.get("subject")
         return None
 
-def test_parse_message_from_sender_success():
+def test_parse_message_from_sender_success(background_loop):
     messages = [
         {"from": "Mafia Online <mafia@mail.dottap.com>", "subject": "Mafia Online Registration", "time": "Just Now"},
         {"from": "AI TOOLS", "subject": "AI Newsletter", "time": "10 mins ago"}
@@ -20,36 +19,36 @@ def test_parse_message_from_sender_success():
     sender = "Mafia Online <mafia@mail.dottap.com>"
 
     email_gen = EmailGenerator.__new__(EmailGenerator)
-    email_gen._loop = asyncio.get_event_loop()
+    email_gen._loop = background_loop
     email_gen._async = cast(AsyncMock, DummyAsync())
 
     result = email_gen.parse_message_from_sender(messages, sender)
     assert result == "Mafia Online Registration"
 
-def test_parse_message_from_sender_not_found():
+def test_parse_message_from_sender_not_found(background_loop):
     messages = [
         {"from": "AI TOOLS", "subject": "AI Newsletter", "time": "10 mins ago"}
     ]
     sender = "Mafia Online <mafia@mail.dottap.com>"
 
     email_gen = EmailGenerator.__new__(EmailGenerator)
-    email_gen._loop = asyncio.get_event_loop()
+    email_gen._loop = background_loop
     email_gen._async = cast(AsyncMock, DummyAsync())
 
     result = email_gen.parse_message_from_sender(messages, sender)
     assert result is None
 
-def test_parse_message_from_sender_invalid_messages():
+def test_parse_message_from_sender_invalid_messages(background_loop):
     email_gen = EmailGenerator.__new__(EmailGenerator)
-    email_gen._loop = asyncio.get_event_loop()
+    email_gen._loop = background_loop
     email_gen._async = cast(AsyncMock, DummyAsync())
 
     with pytest.raises(ValueError):
         email_gen.parse_message_from_sender("not a list", "sender@example.com") # type: ignore
 
-def test_parse_message_from_sender_invalid_sender():
+def test_parse_message_from_sender_invalid_sender(background_loop):
     email_gen = EmailGenerator.__new__(EmailGenerator)
-    email_gen._loop = asyncio.get_event_loop()
+    email_gen._loop = background_loop
     email_gen._async = cast(AsyncMock, DummyAsync())
 
     with pytest.raises(ValueError):
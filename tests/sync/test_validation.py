@@ -0,0 +1,41 @@
+# Copyright (C) 2025 unelected
+#
+# This file is part of email_generator.
+#
+# account_generator is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# account_generator is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with account_generator. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from emailnator.helpers.validation import is_list_of
+
+
+class _Address(str):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ([], True),
+        (["a@gmail.com", "b@gmail.com"], True),
+        (["a@gmail.com", _Address("b@gmail.com")], True),
+        (["a@gmail.com", 1], False),
+        ("a@gmail.com", False),
+        (None, False),
+    ],
+)
+def test_is_list_of_str(value, expected):
+    """Should accept lists of str (including subclasses) and nothing else."""
+    assert is_list_of(value, str) is expected